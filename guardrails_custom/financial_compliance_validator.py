@@ -50,6 +50,13 @@ try:
 except ImportError:
     SPACY_AVAILABLE = False
 
+# Optional Aho-Corasick engine for multi-keyword scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 @register_validator(name="financial-compliance", data_type="string")
 class FinancialComplianceValidator(Validator):
@@ -69,11 +76,12 @@ class FinancialComplianceValidator(Validator):
         use_llm_verification: bool = True,
         strict_compliance: bool = False,
         fast_mode: bool = False,
+        verbose: bool = True,
         **kwargs
     ):
         """
         Initialize the financial compliance validator.
-        
+
         Args:
             require_disclaimers: Require appropriate disclaimers for financial advice
             check_guaranteed_returns: Block guaranteed return language
@@ -82,6 +90,7 @@ class FinancialComplianceValidator(Validator):
             use_llm_verification: Use LLM for advanced compliance checking
             strict_compliance: Apply strictest regulatory standards
             fast_mode: Optimize for speed by using pattern-first hybrid approach
+            verbose: Print per-stage progress and timings during validation
         """
         super().__init__(**kwargs)
         self.require_disclaimers = require_disclaimers
@@ -91,6 +100,10 @@ class FinancialComplianceValidator(Validator):
         self.use_llm_verification = use_llm_verification
         self.strict_compliance = strict_compliance
         self.fast_mode = fast_mode
+        self.verbose = verbose
+        # Progress output goes through this hook so background callers
+        # (e.g. prefetch threads) can run validations silently
+        self._log = print if verbose else (lambda *args, **kwargs: None)
         
         # Financial topic keywords for detection
         self.financial_keywords = {
@@ -158,6 +171,15 @@ class FinancialComplianceValidator(Validator):
             r"\bregistered\s+investment\s+advisor\b"
         ]
         
+        # Aho-Corasick automatons find every keyword hit in one linear pass
+        # over the text instead of one substring scan per keyword
+        if AHOCORASICK_AVAILABLE:
+            self._financial_automaton = self._build_automaton(self.financial_keywords)
+            self._disclaimer_automaton = self._build_automaton(self.disclaimer_keywords)
+        else:
+            self._financial_automaton = None
+            self._disclaimer_automaton = None
+
         # Initialize spaCy NER if available (skip in fast mode for performance)
         self.spacy_nlp = None
         if SPACY_AVAILABLE and use_llm_verification and not fast_mode:  # Only load if we want enhanced analysis
@@ -167,6 +189,15 @@ class FinancialComplianceValidator(Validator):
                 # Fallback gracefully if spaCy setup fails
                 pass
     
+    @staticmethod
+    def _build_automaton(keywords):
+        """Build an Aho-Corasick automaton over a keyword set."""
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
     def _initialize_spacy_ner(self):
         """Initialize spaCy NLP with custom financial risk patterns."""
         try:
@@ -234,23 +265,26 @@ class FinancialComplianceValidator(Validator):
         import time
         
         validation_start = time.perf_counter()
-        print(f"🔍 Starting validation: '{value[:50]}{'...' if len(value) > 50 else ''}'")
+        self._log(f"🔍 Starting validation: '{value[:50]}{'...' if len(value) > 50 else ''}'")
         
         if not value or not isinstance(value, str):
-            print("⚡ Skipping empty/invalid input")
+            self._log("⚡ Skipping empty/invalid input")
             return PassResult()
         
+        # Lowercase once - every stage below works on the same folded copy
+        value_lower = value.lower()
+
         # Stage 1: Check if this content contains financial advice
         stage1_start = time.perf_counter()
-        contains_financial = self._contains_financial_content(value)
+        contains_financial = self._contains_financial_content(value, value_lower)
         stage1_time = time.perf_counter() - stage1_start
         
         if not contains_financial:
             total_time = time.perf_counter() - validation_start
-            print(f"✅ Non-financial content - passed ({stage1_time:.6f}s detection, {total_time:.6f}s total)")
+            self._log(f"✅ Non-financial content - passed ({stage1_time:.6f}s detection, {total_time:.6f}s total)")
             return PassResult()  # Not financial content, no compliance needed
         
-        print(f"💰 Financial content detected ({stage1_time:.6f}s) - running compliance checks...")
+        self._log(f"💰 Financial content detected ({stage1_time:.6f}s) - running compliance checks...")
         
         compliance_issues = []
         stage2_start = time.perf_counter()
@@ -258,46 +292,46 @@ class FinancialComplianceValidator(Validator):
         # Stage 2: Run compliance checks
         if self.check_guaranteed_returns:
             check_start = time.perf_counter()
-            guaranteed_issues = self._check_guaranteed_returns(value)
+            guaranteed_issues = self._check_guaranteed_returns(value, value_lower)
             check_time = time.perf_counter() - check_start
             compliance_issues.extend(guaranteed_issues)
-            print(f"   📊 Guaranteed returns check: {len(guaranteed_issues)} issues ({check_time:.6f}s)")
+            self._log(f"   📊 Guaranteed returns check: {len(guaranteed_issues)} issues ({check_time:.6f}s)")
         
         if self.check_specific_predictions:
             check_start = time.perf_counter()
-            prediction_issues = self._check_specific_predictions(value)
+            prediction_issues = self._check_specific_predictions(value, value_lower)
             check_time = time.perf_counter() - check_start
             compliance_issues.extend(prediction_issues)
-            print(f"   🎯 Specific predictions check: {len(prediction_issues)} issues ({check_time:.6f}s)")
+            self._log(f"   🎯 Specific predictions check: {len(prediction_issues)} issues ({check_time:.6f}s)")
         
         if self.require_disclaimers:
             check_start = time.perf_counter()
-            disclaimer_issues = self._check_disclaimers(value)
+            disclaimer_issues = self._check_disclaimers(value, value_lower)
             check_time = time.perf_counter() - check_start
             compliance_issues.extend(disclaimer_issues)
-            print(f"   ⚠️  Disclaimers check: {len(disclaimer_issues)} issues ({check_time:.6f}s)")
+            self._log(f"   ⚠️  Disclaimers check: {len(disclaimer_issues)} issues ({check_time:.6f}s)")
         
         if self.check_unlicensed_advice:
             check_start = time.perf_counter()
-            licensing_issues = self._check_unlicensed_advice(value)
+            licensing_issues = self._check_unlicensed_advice(value, value_lower)
             check_time = time.perf_counter() - check_start
             compliance_issues.extend(licensing_issues)
-            print(f"   📝 Unlicensed advice check: {len(licensing_issues)} issues ({check_time:.6f}s)")
+            self._log(f"   📝 Unlicensed advice check: {len(licensing_issues)} issues ({check_time:.6f}s)")
         
         stage2_time = time.perf_counter() - stage2_start
-        print(f"   ⚡ Pattern-based checks completed: {len(compliance_issues)} total issues ({stage2_time:.6f}s)")
+        self._log(f"   ⚡ Pattern-based checks completed: {len(compliance_issues)} total issues ({stage2_time:.6f}s)")
         
         # Stage 2.5: Fast mode optimization - only use LLM if pattern detection is inconclusive
         if self.fast_mode and compliance_issues:
             # Pattern detection found issues - skip expensive LLM check
-            print(f"   🚀 Fast mode: Skipping LLM check (pattern detection found issues)")
+            self._log(f"   🚀 Fast mode: Skipping LLM check (pattern detection found issues)")
         elif self.use_llm_verification and (not self.fast_mode or not compliance_issues):
             # Run LLM check if: not in fast mode OR fast mode but no pattern issues found
             llm_start = time.perf_counter()
             llm_issues = self._llm_compliance_check(value)
             llm_time = time.perf_counter() - llm_start
             compliance_issues.extend(llm_issues)
-            print(f"   🤖 LLM compliance check: {len(llm_issues)} issues ({llm_time:.6f}s)")
+            self._log(f"   🤖 LLM compliance check: {len(llm_issues)} issues ({llm_time:.6f}s)")
         
         # Stage 2.6: Enhanced spaCy NER analysis (skip in fast mode)
         if not self.fast_mode:
@@ -306,27 +340,27 @@ class FinancialComplianceValidator(Validator):
             spacy_time = time.perf_counter() - spacy_start
             if spacy_entities:
                 compliance_issues.append(f"Enhanced NLP analysis detected: {', '.join(spacy_entities[:3])}")
-            print(f"   🧠 spaCy NER analysis: {len(spacy_entities)} entities ({spacy_time:.6f}s)")
+            self._log(f"   🧠 spaCy NER analysis: {len(spacy_entities)} entities ({spacy_time:.6f}s)")
         else:
-            print(f"   🚀 Fast mode: Skipping spaCy NER analysis")
+            self._log(f"   🚀 Fast mode: Skipping spaCy NER analysis")
         
         # Stage 3: Determine result
         total_time = time.perf_counter() - validation_start
         
         if compliance_issues:
             issues_summary = "; ".join(compliance_issues)
-            print(f"❌ BLOCKED: {len(compliance_issues)} violations found ({total_time:.6f}s total)")
+            self._log(f"❌ BLOCKED: {len(compliance_issues)} violations found ({total_time:.6f}s total)")
             return FailResult(
                 error_message=f"Financial compliance violations: {issues_summary}",
                 fix_value=self._suggest_compliant_version(value, compliance_issues)
             )
         
-        print(f"✅ PASSED: No compliance violations ({total_time:.6f}s total)")
+        self._log(f"✅ PASSED: No compliance violations ({total_time:.6f}s total)")
         return PassResult()
     
-    def _contains_financial_content(self, text: str) -> bool:
+    def _contains_financial_content(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains financial advice or investment content using multiple methods."""
-        
+
         # Method 1: LLM-based classification (most robust)
         if hasattr(self, '_llm_financial_classifier'):
             try:
@@ -335,12 +369,17 @@ class FinancialComplianceValidator(Validator):
                     return llm_result
             except Exception:
                 pass  # Fall back to other methods
-        
+
         # Method 2: Enhanced pattern detection
-        text_lower = text.lower()
-        
-        # Financial keywords (original method)
-        financial_keyword_count = sum(1 for keyword in self.financial_keywords if keyword in text_lower)
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Financial keywords - count distinct keywords present (one automaton
+        # pass, or the original per-keyword substring scan without pyahocorasick)
+        if self._financial_automaton is not None:
+            financial_keyword_count = len({kw for _, kw in self._financial_automaton.iter(text_lower)})
+        else:
+            financial_keyword_count = sum(1 for keyword in self.financial_keywords if keyword in text_lower)
         advice_pattern_count = sum(1 for pattern in self.advice_indicators if re.search(pattern, text_lower))
         
         # Enhanced price prediction patterns
@@ -379,11 +418,12 @@ class FinancialComplianceValidator(Validator):
         # This method will be injected by the main application if LLM is available
         return None
     
-    def _check_guaranteed_returns(self, text: str) -> List[str]:
+    def _check_guaranteed_returns(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Check for prohibited guaranteed return language."""
         issues = []
-        text_lower = text.lower()
-        
+        if text_lower is None:
+            text_lower = text.lower()
+
         for pattern in self.guaranteed_return_patterns:
             if re.search(pattern, text_lower):
                 issues.append("Contains prohibited guaranteed return language")
@@ -391,11 +431,12 @@ class FinancialComplianceValidator(Validator):
         
         return issues
     
-    def _check_specific_predictions(self, text: str) -> List[str]:
+    def _check_specific_predictions(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Check for overly specific price predictions or timing."""
         issues = []
-        text_lower = text.lower()
-        
+        if text_lower is None:
+            text_lower = text.lower()
+
         for pattern in self.specific_prediction_patterns:
             if re.search(pattern, text_lower):
                 # Check if prediction has uncertainty language
@@ -408,28 +449,33 @@ class FinancialComplianceValidator(Validator):
         
         return issues
     
-    def _check_disclaimers(self, text: str) -> List[str]:
+    def _check_disclaimers(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Check if appropriate disclaimers are present."""
         issues = []
-        text_lower = text.lower()
-        
+        if text_lower is None:
+            text_lower = text.lower()
+
         # Check if text contains advice indicators
         has_advice = any(re.search(pattern, text_lower) for pattern in self.advice_indicators)
         
         if has_advice:
             # Check if disclaimers are present
-            has_disclaimer = any(disclaimer in text_lower for disclaimer in self.disclaimer_keywords)
-            
+            if self._disclaimer_automaton is not None:
+                has_disclaimer = next(self._disclaimer_automaton.iter(text_lower), None) is not None
+            else:
+                has_disclaimer = any(disclaimer in text_lower for disclaimer in self.disclaimer_keywords)
+
             if not has_disclaimer:
                 issues.append("Financial advice provided without required disclaimers")
         
         return issues
     
-    def _check_unlicensed_advice(self, text: str) -> List[str]:
+    def _check_unlicensed_advice(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Check for indicators of potentially unlicensed financial advice."""
         issues = []
-        text_lower = text.lower()
-        
+        if text_lower is None:
+            text_lower = text.lower()
+
         # Check for licensing claims
         has_licensing_claim = any(re.search(pattern, text_lower) for pattern in self.licensing_patterns)
         has_advice = any(re.search(pattern, text_lower) for pattern in self.advice_indicators)
@@ -11,22 +11,102 @@ An interactive tool that helps users write compliant financial content by:
 This demonstrates real-world application of the Financial Compliance Validator.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
 import os
+import pickle
 import sys
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
-from groq import Groq
-from dotenv import load_dotenv
+
+# The Groq SDK (and its pydantic/httpx dependencies) is imported lazily on
+# first LLM call - menu-only sessions never pay its import cost
+
+# Optional semantic-cache dependencies (local embeddings + vector math)
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# Optional Aho-Corasick engine for multi-keyword scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional HTTP/2 for the pooled Groq transports: httpx needs the h2
+# package to negotiate it, so without h2 the clients stay on HTTP/1.1
+# (same keep-alive pool, just no multiplexing)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Add current directory to path for imports
 current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
+from guardrails.validator_base import FailResult
+
 from financial_compliance_validator import FinancialComplianceValidator
 
-load_dotenv()
+
+# Fused rewrite pass for _rule_based_enhancement: one alternation matches
+# every phrase that needs softening (longer 'will ...' phrases win over the
+# bare 'will' via the greedy optional group) and _REPL dispatches each hit
+# to its replacement, so the text is walked once instead of once per rule
+_REPL = {
+    'guarantee': 'potentially',
+    'guarantees': 'potentially',
+    'guaranteed': 'potentially',
+    'cannot lose': 'may have lower risk',
+    'risk free': 'lower risk',
+    'risk-free': 'lower risk',
+    'will definitely': 'might',
+    'will hit': 'could potentially reach',
+    'will be worth': 'might be valued at',
+    'will double': 'could potentially increase',
+    'will': 'might',
+}
+_ALT = re.compile(
+    r'\b(?:guarantee[sd]?|cannot lose|risk[- ]free'
+    r'|will(?: definitely| hit| be worth| double)?)\b',
+    re.IGNORECASE)
+
+
+def _load_env_file(path: str = ".env") -> None:
+    """Load KEY=VALUE pairs from a .env file into the environment.
+
+    A dozen lines of parsing replace the python-dotenv import (and its
+    startup cost); existing environment variables always win.
+    """
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                if line.startswith('export '):
+                    line = line[len('export '):]
+                key, _, value = line.partition('=')
+                key = key.strip()
+                value = value.strip().strip('"').strip("'")
+                if key:
+                    os.environ.setdefault(key, value)
+    except OSError:
+        pass  # No .env file is a perfectly valid setup
 
 
 class InteractiveFinancialAdvisor:
@@ -39,58 +119,181 @@ class InteractiveFinancialAdvisor:
     RED = '\033[91m'
     BOLD = '\033[1m'
     END = '\033[0m'
-    
+
+    # Cosine similarity above which two questions are treated as the same
+    SEMANTIC_CACHE_THRESHOLD = 0.92
+
+    # Keywords that mark content as financial for disclaimer purposes
+    FINANCIAL_TERMS = ('invest', 'stock', 'profit', 'money', 'buy', 'sell',
+                       'trading', 'portfolio')
+
+    # Demo questions shown (and pre-fetched) by _test_sample_questions
+    SAMPLE_QUESTIONS = (
+        "Should I invest all my savings in Tesla stock?",
+        "What's a guaranteed way to double my money?",
+        "Is cryptocurrency a good investment for retirement?",
+        "Should I buy or rent a house in this market?",
+        "How can I get rich quickly with stocks?"
+    )
+
+    # Educational compliance tips
+    compliance_tips = (
+        "Always include disclaimers like 'Not financial advice'",
+        "Avoid guaranteed return language (e.g., 'guaranteed profits')",
+        "Use uncertainty language for predictions (e.g., 'might', 'could')",
+        "Mention consulting professionals for serious decisions",
+        "Avoid overly specific price/date predictions",
+        "Include risk warnings where appropriate"
+    )
+
+    # Example compliant phrases
+    compliant_examples = {
+        "disclaimer": "This is not financial advice. Please consult a qualified financial advisor.",
+        "risk_warning": "All investments carry risk. Past performance doesn't guarantee future results.",
+        "uncertainty": ["may potentially", "could possibly", "might consider"],
+        "professional": "consult with a licensed financial professional",
+        "educational": "for educational purposes only"
+    }
+
+    # Static screens rendered once at class definition - each display is a
+    # single buffered write instead of a dozen print() round-trips
+    _MENU_TEXT = (
+        f"\n{CYAN}{'=' * 70}{END}\n"
+        f"{BOLD}{CYAN}🤖 AI FINANCIAL ADVISOR (with Compliance){END}\n"
+        f"{CYAN}{'=' * 70}{END}\n"
+        f"\n{BOLD}Options:{END}\n"
+        f"  {GREEN}1.{END} Ask for financial advice (AI-generated & validated)\n"
+        f"  {GREEN}2.{END} Validate your own financial content\n"
+        f"  {GREEN}3.{END} See compliance tips\n"
+        f"  {GREEN}4.{END} View example compliant phrases\n"
+        f"  {GREEN}5.{END} Test with sample questions\n"
+        f"  {RED}6.{END} Exit"
+    )
+
+    _WELCOME_TEXT = (
+        f"{CYAN}{'=' * 70}{END}\n"
+        f"{BOLD}{CYAN}🏦 AI FINANCIAL ADVISOR WITH COMPLIANCE VALIDATION{END}\n"
+        f"{CYAN}{'=' * 70}{END}\n"
+        f"\n{BOLD}Welcome! This tool provides AI-generated financial advice that is:{END}\n"
+        f"{GREEN}✅ Automatically validated for regulatory compliance{END}\n"
+        f"{GREEN}✅ Enhanced with required disclaimers and risk warnings{END}\n"
+        f"{GREEN}✅ Free from prohibited guarantee language{END}\n"
+        f"{GREEN}✅ Properly hedged with uncertainty language{END}\n"
+        f"\n{YELLOW}💡 How it works:{END}\n"
+        "   1. You ask a financial question\n"
+        "   2. AI generates advice\n"
+        "   3. Validator ensures compliance\n"
+        "   4. You receive safe, compliant advice"
+    )
+
+    _TIPS_TEXT = (
+        "\n📚 FINANCIAL COMPLIANCE TIPS\n"
+        + "=" * 50 + "\n"
+        + "\n".join(f"{i}. {tip}" for i, tip in enumerate(compliance_tips, 1))
+        + "\n\n🎯 Key Principles:\n"
+        "• Transparency: Be clear about risks and uncertainties\n"
+        "• Humility: Avoid absolute statements about future performance\n"
+        "• Education: Focus on informing rather than directing\n"
+        "• Protection: Always encourage professional consultation"
+    )
+
+    _EXAMPLES_TEXT = (
+        "\n✅ COMPLIANT PHRASE EXAMPLES\n"
+        + "=" * 50 + "\n"
+        "\n📌 Disclaimers:\n"
+        f"  • '{compliant_examples['disclaimer']}'\n"
+        f"  • '{compliant_examples['risk_warning']}'\n"
+        f"  • '{compliant_examples['educational']}'\n"
+        "\n📌 Uncertainty Language:\n"
+        f"  • Examples: {', '.join(compliant_examples['uncertainty'])}\n"
+        "  • Instead of 'will' → use 'might', 'could', 'may'\n"
+        "  • Instead of 'guaranteed' → use 'potential', 'possible'\n"
+        "  • Instead of 'definitely' → use 'likely', 'probably'\n"
+        "\n📌 Professional References:\n"
+        f"  • '{compliant_examples['professional']}'\n"
+        "  • 'Seek advice from a licensed investment advisor'\n"
+        "  • 'Discuss with your financial planner'"
+    )
+
     def __init__(self):
         """Initialize the interactive advisor."""
-        self.validator = FinancialComplianceValidator(
+        self._validator_config = dict(
             require_disclaimers=True,
             check_guaranteed_returns=True,
             check_specific_predictions=True,
             check_unlicensed_advice=True,
-            use_llm_verification=False  # We'll use LLM for enhancement instead
+            use_llm_verification=False,  # We'll use LLM for enhancement instead
         )
+        self.validator = FinancialComplianceValidator(**self._validator_config)
+        _load_env_file()
         self.groq_api_key = os.getenv("GROQ_API_KEY")
-        self.groq_model = os.getenv("GROQ_MODEL", "llama3-8b-8192")  # Default to llama3 if not set
-        
-        # Initialize Groq client
-        self.groq_client = Groq(api_key=self.groq_api_key) if self.groq_api_key else None
-        
-        # Educational compliance tips
-        self.compliance_tips = [
-            "Always include disclaimers like 'Not financial advice'",
-            "Avoid guaranteed return language (e.g., 'guaranteed profits')",
-            "Use uncertainty language for predictions (e.g., 'might', 'could')",
-            "Mention consulting professionals for serious decisions",
-            "Avoid overly specific price/date predictions",
-            "Include risk warnings where appropriate"
-        ]
-        
-        # Example compliant phrases
-        self.compliant_examples = {
-            "disclaimer": "This is not financial advice. Please consult a qualified financial advisor.",
-            "risk_warning": "All investments carry risk. Past performance doesn't guarantee future results.",
-            "uncertainty": ["may potentially", "could possibly", "might consider"],
-            "professional": "consult with a licensed financial professional",
-            "educational": "for educational purposes only"
-        }
-    
+        self.groq_model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")  # Fastest Groq model if not set
+
+        # Groq clients are created on first use (the async client overlaps
+        # LLM calls with local validation work)
+        self._groq_client = None
+        self._async_groq_client = None
+        # One event loop serves the whole session: the async client's
+        # keep-alive pool is bound to the loop it first ran on, so a
+        # fresh asyncio.run() per question would strand its connections
+        self._async_loop = None
+        # Completion callables with model/max_tokens pre-bound, built
+        # alongside their clients so call sites only supply what varies
+        self._create_completion = None
+        self._create_completion_async = None
+
+        # Validation results keyed by a BLAKE2 digest of the content -
+        # validator runs are deterministic with use_llm_verification=False
+        self._validate_cache = {}
+
+        # Semantic response cache: row i of self._cache_emb is the normalized
+        # embedding of self._semantic_cache[i] = (question, advice, validation_result)
+        self._semantic_cache = []
+        self._cache_emb = None
+        self._embedder = None
+        self._cache_path = Path.home() / ".cache" / "financial_advisor_semantic_cache.pkl"
+        if SEMANTIC_CACHE_AVAILABLE:
+            self._load_semantic_cache()
+            atexit.register(self._save_semantic_cache)
+
+        # Aho-Corasick automatons find any-of-all keywords in one linear
+        # pass instead of one substring scan per keyword
+        if AHOCORASICK_AVAILABLE:
+            self._fin_automaton = self._build_automaton(self.FINANCIAL_TERMS)
+            self._disclaimer_automaton = self._build_automaton(self.validator.disclaimer_keywords)
+        else:
+            self._fin_automaton = None
+            self._disclaimer_automaton = None
+        # Single-pass compiled alternations for the no-pyahocorasick path:
+        # one pattern walk instead of one substring scan per keyword, and
+        # no .lower() allocation thanks to re.IGNORECASE
+        self._fin_terms_re = re.compile(
+            '|'.join(re.escape(k) for k in self.FINANCIAL_TERMS), re.IGNORECASE)
+        self._disclaimer_re = re.compile(
+            '|'.join(re.escape(k) for k in self.validator.disclaimer_keywords), re.IGNORECASE)
+        # The validator's advice indicators fused into one compiled
+        # alternation - one scan instead of a per-pattern re.search loop
+        self._advice_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.validator.advice_indicators), re.IGNORECASE)
+
+        # On-disk cache of LLM enhancements keyed by content digest
+        self._enhance_cache_dir = Path.home() / ".cache" / "guardrails_advisor"
+
+        # Pre-fetched answers for the sample questions, populated in the
+        # background so the demo is instant by the time it is opened
+        self._sample_cache = {}
+        self._sample_cache_path = Path.home() / ".cache" / "financial_advisor_samples.json"
+        if self.groq_api_key:
+            threading.Thread(target=self._prefetch_sample_answers, daemon=True).start()
+
     def run(self):
         """Run the interactive financial advisor interface."""
         self._show_welcome()
         
         while True:
             try:
-                print(f"\n{self.CYAN}{'=' * 70}{self.END}")
-                print(f"{self.BOLD}{self.CYAN}🤖 AI FINANCIAL ADVISOR (with Compliance){self.END}")
-                print(f"{self.CYAN}{'=' * 70}{self.END}")
-                print(f"\n{self.BOLD}Options:{self.END}")
-                print(f"  {self.GREEN}1.{self.END} Ask for financial advice (AI-generated & validated)")
-                print(f"  {self.GREEN}2.{self.END} Validate your own financial content")
-                print(f"  {self.GREEN}3.{self.END} See compliance tips")
-                print(f"  {self.GREEN}4.{self.END} View example compliant phrases")
-                print(f"  {self.GREEN}5.{self.END} Test with sample questions")
-                print(f"  {self.RED}6.{self.END} Exit")
-                
+                print(self._MENU_TEXT)
+
                 choice = input(f"\n{self.YELLOW}Select option (1-6): {self.END}").strip()
                 
                 if choice == "1":
@@ -115,62 +318,281 @@ class InteractiveFinancialAdvisor:
             except Exception as e:
                 print(f"{self.RED}❌ An error occurred: {e}{self.END}")
     
+    # Keep connections warm across the whole session so follow-up calls
+    # skip the TCP+TLS handshake; HTTP/2 (when h2 is installed)
+    # multiplexes concurrent requests
+    _HTTP_LIMITS = dict(max_keepalive_connections=10, keepalive_expiry=300)
+    _HTTP_TIMEOUT = 30.0
+
+    def _get_groq_client(self):
+        """Create (once) and return the synchronous Groq client."""
+        if self._groq_client is None:
+            import httpx
+            from groq import Groq
+            http_client = httpx.Client(
+                transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, retries=2),
+                timeout=self._HTTP_TIMEOUT,
+                limits=httpx.Limits(**self._HTTP_LIMITS),
+            )
+            self._groq_client = Groq(api_key=self.groq_api_key, http_client=http_client)
+            self._create_completion = functools.partial(
+                self._groq_client.chat.completions.create,
+                model=self.groq_model,
+                max_tokens=500,
+            )
+        return self._groq_client
+
+    def _get_async_groq_client(self):
+        """Create (once) and return the asynchronous Groq client."""
+        if self._async_groq_client is None:
+            import httpx
+            from groq import AsyncGroq
+            http_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, retries=2),
+                timeout=self._HTTP_TIMEOUT,
+                limits=httpx.Limits(**self._HTTP_LIMITS),
+            )
+            self._async_groq_client = AsyncGroq(api_key=self.groq_api_key, http_client=http_client)
+            self._create_completion_async = functools.partial(
+                self._async_groq_client.chat.completions.create,
+                model=self.groq_model,
+                max_tokens=500,
+            )
+        return self._async_groq_client
+
+    def _run_async(self, coro):
+        """Run a coroutine on the session's long-lived event loop.
+
+        asyncio.run() closes its loop on return, which would leave the
+        pooled async client holding connections bound to a dead loop and
+        make the next call fail; reusing one loop keeps the pool valid
+        for the whole session.
+        """
+        if self._async_loop is None:
+            self._async_loop = asyncio.new_event_loop()
+            atexit.register(self._close_async_loop)
+        return self._async_loop.run_until_complete(coro)
+
+    def _close_async_loop(self):
+        """Close the shared async client and its event loop on exit."""
+        loop = self._async_loop
+        if loop is None or loop.is_closed():
+            return
+        if self._async_groq_client is not None:
+            try:
+                loop.run_until_complete(self._async_groq_client.close())
+            except Exception:
+                pass  # Shutdown is best-effort
+        loop.close()
+
+    async def _ask_async(self, prompt: str, temperature: float,
+                         max_tokens: Optional[int] = None) -> str:
+        """Run a single-user-message completion and return the stripped text."""
+        self._get_async_groq_client()
+        overrides = {} if max_tokens is None else {'max_tokens': max_tokens}
+        completion = await self._create_completion_async(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            **overrides,
+        )
+        return completion.choices[0].message.content.strip()
+
+    @staticmethod
+    def _enhancement_budget(content: str, already_compliant: bool = False) -> int:
+        """Token budget proportional to the content being enhanced.
+
+        Enhancements roughly preserve length plus a disclaimer, so capping
+        the budget cuts tail latency on short inputs; polishing text that
+        is already compliant needs even less headroom.
+        """
+        budget = min(500, max(128, len(content.split()) * 3 + 64))
+        return min(budget, 256) if already_compliant else budget
+
+    @staticmethod
+    def _build_automaton(keywords):
+        """Build an Aho-Corasick automaton over lowercased keywords."""
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), keyword)
+        automaton.make_automaton()
+        return automaton
+
+    def _embed_question(self, question: str):
+        """Compute a normalized embedding for a question (lazy-loads the model)."""
+        if self._embedder is None:
+            self._embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        embedding = self._embedder.encode(question).astype(np.float32)
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else embedding
+
+    def _semantic_cache_lookup(self, question: str):
+        """Look up a semantically equivalent question in the response cache."""
+        if not SEMANTIC_CACHE_AVAILABLE or self._cache_emb is None:
+            return None
+        q_emb = self._embed_question(question)
+        # One matmul against the stacked embedding matrix, then argmax
+        similarities = self._cache_emb @ q_emb
+        best = int(np.argmax(similarities))
+        if similarities[best] > self.SEMANTIC_CACHE_THRESHOLD:
+            return self._semantic_cache[best]
+        return None
+
+    def _semantic_cache_store(self, question: str, ai_advice: str, validation_result):
+        """Add a question/advice/validation triple to the semantic cache."""
+        if not SEMANTIC_CACHE_AVAILABLE:
+            return
+        q_emb = self._embed_question(question)
+        self._semantic_cache.append((question, ai_advice, validation_result))
+        if self._cache_emb is None:
+            self._cache_emb = q_emb.reshape(1, -1)
+        else:
+            self._cache_emb = np.vstack([self._cache_emb, q_emb])
+
+    def _load_semantic_cache(self):
+        """Load the persisted semantic cache from disk, if present."""
+        try:
+            with open(self._cache_path, 'rb') as f:
+                saved = pickle.load(f)
+            self._semantic_cache = saved['entries']
+            self._cache_emb = saved['embeddings']
+        except (OSError, pickle.PickleError, KeyError):
+            self._semantic_cache = []
+            self._cache_emb = None
+
+    def _save_semantic_cache(self):
+        """Persist the semantic cache to disk on exit."""
+        if not self._semantic_cache:
+            return
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path, 'wb') as f:
+                pickle.dump({'entries': self._semantic_cache,
+                             'embeddings': self._cache_emb}, f)
+        except (OSError, pickle.PickleError):
+            pass  # Cache persistence is best-effort
+
+    _VALIDATE_CACHE_MAX = 1024
+
+    def _validate_content(self, content: str, validator=None):
+        """Run the compliance validator, memoized by content digest.
+
+        BLAKE2 is SIMD-accelerated in CPython and far cheaper than
+        re-running the validator's regex/keyword passes on repeat content.
+        Background callers may pass their own (quiet) validator; results
+        land in the shared cache either way.
+        """
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        result = self._validate_cache.get(digest)
+        if result is None:
+            result = (validator or self.validator)._validate(content, {})
+            if len(self._validate_cache) >= self._VALIDATE_CACHE_MAX:
+                self._validate_cache.pop(next(iter(self._validate_cache)))
+            self._validate_cache[digest] = result
+        return result
+
+    def _print_raw_response(self, ai_advice: str):
+        """Print the raw AI response block."""
+        print(f"\n{self.CYAN}📝 RAW AI RESPONSE:{self.END}")
+        print(f"{self.CYAN}{'─' * 60}{self.END}")
+        print(f"{ai_advice}")
+        print(f"{self.CYAN}{'─' * 60}{self.END}")
+
+    async def _generate_and_validate_async(self, question: str):
+        """Generate advice, then validate while speculatively enhancing.
+
+        The enhancement call is kicked off in parallel with the (local)
+        validator run: if validation passes it is cancelled, otherwise the
+        answer is already in flight and we save a full LLM round-trip.
+        """
+        prompt = f"""You are a financial advisor. Answer this question: {question}
+
+        Provide helpful financial advice but be specific and actionable."""
+
+        # Stream the completion and render tokens as they arrive - the first
+        # token shows up in ~100ms instead of after the full generation
+        self._get_async_groq_client()
+        stream = await self._create_completion_async(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            stream=True
+        )
+        print(f"\n{self.CYAN}📝 RAW AI RESPONSE:{self.END}")
+        print(f"{self.CYAN}{'─' * 60}{self.END}")
+        buf = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                print(delta, end='', flush=True)
+                buf.append(delta)
+        print(f"\n{self.CYAN}{'─' * 60}{self.END}")
+        ai_advice = ''.join(buf).strip()
+
+        print("\n🔍 Validating for compliance...")
+        enhance_task = asyncio.create_task(
+            self._ask_async(self._build_enhancement_prompt(ai_advice), temperature=0.3,
+                            max_tokens=self._enhancement_budget(ai_advice))
+        )
+        # Run the validator off the event loop so the enhancement request
+        # makes progress while it works
+        validation_result = await asyncio.to_thread(self._validate_content, ai_advice)
+
+        speculative_fix = None
+        if isinstance(validation_result, FailResult):
+            speculative_fix = await enhance_task
+        else:
+            enhance_task.cancel()
+        return ai_advice, validation_result, speculative_fix
+
     def _get_ai_financial_advice(self):
         """Get financial advice from AI and validate it for compliance."""
         print("\n🤖 AI FINANCIAL ADVISOR")
         print("-" * 50)
         print("Ask any financial question (or 'back' to return):")
         print("Examples: 'Should I invest in Tesla?', 'Is gold a good investment?'")
-        
+
         question = input(f"\n{self.YELLOW}❓ Your question: {self.END}").strip()
         if question.lower() == 'back':
             return
-        
-        if not self.groq_client:
+
+        if not self.groq_api_key:
             print(f"\n{self.YELLOW}⚠️  Groq API key not found. Please set GROQ_API_KEY in .env file{self.END}")
             return
-        
-        print("\n🤔 AI is thinking...")
-        
-        # Generate AI response using Groq SDK
-        prompt = f"""You are a financial advisor. Answer this question: {question}
-        
-        Provide helpful financial advice but be specific and actionable."""
-        
+
         try:
-            completion = self.groq_client.chat.completions.create(
-                model=self.groq_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            ai_advice = completion.choices[0].message.content.strip()
-            
-            print(f"\n{self.CYAN}📝 RAW AI RESPONSE:{self.END}")
-            print(f"{self.CYAN}{'─' * 60}{self.END}")
-            print(f"{ai_advice}")
-            print(f"{self.CYAN}{'─' * 60}{self.END}")
-            
-            # Validate the AI response
-            print("\n🔍 Validating for compliance...")
-            validation_result = self.validator._validate(ai_advice, {})
-            
-            if hasattr(validation_result, 'error_message'):
+            # Check the semantic cache first - a hit skips the Groq call and
+            # the validator entirely
+            cached = self._semantic_cache_lookup(question)
+            speculative_fix = None
+            if cached:
+                cached_question, ai_advice, validation_result = cached
+                print(f"\n{self.GREEN}⚡ Found cached answer for similar question: '{cached_question}'{self.END}")
+                self._print_raw_response(ai_advice)
+            else:
+                print("\n🤔 AI is thinking...")
+                ai_advice, validation_result, speculative_fix = self._run_async(
+                    self._generate_and_validate_async(question)
+                )
+                self._semantic_cache_store(question, ai_advice, validation_result)
+
+            is_fail = isinstance(validation_result, FailResult)
+            if is_fail:
                 print(f"\n{self.YELLOW}⚠️  Compliance issues detected: {validation_result.error_message}{self.END}")
                 print(f"\n{self.GREEN}✨ FIXED & COMPLIANT VERSION:{self.END}")
                 print(f"{self.GREEN}{'=' * 50}{self.END}")
-                compliant_advice = validation_result.fix_value if validation_result.fix_value else self._rule_based_enhancement(ai_advice)
+                compliant_advice = (speculative_fix or validation_result.fix_value
+                                    or self._rule_based_enhancement(ai_advice))
                 print(f"{self.BOLD}{compliant_advice}{self.END}")
                 print(f"{self.GREEN}{'=' * 50}{self.END}")
                 
-                # Show what changed
+                # Show what changed (fold each string once, not per check)
                 print("\n📊 What was changed:")
-                if "guaranteed" in ai_advice.lower() and "guaranteed" not in compliant_advice.lower():
+                advice_lower = ai_advice.lower()
+                compliant_lower = compliant_advice.lower()
+                if "guaranteed" in advice_lower and "guaranteed" not in compliant_lower:
                     print("  • Removed guaranteed return language")
-                if "not financial advice" not in ai_advice.lower() and "not financial advice" in compliant_advice.lower():
+                if "not financial advice" not in advice_lower and "not financial advice" in compliant_lower:
                     print("  • Added required disclaimer")
-                if "will" in ai_advice.lower() and ("might" in compliant_advice.lower() or "could" in compliant_advice.lower()):
+                if "will" in advice_lower and ("might" in compliant_lower or "could" in compliant_lower):
                     print("  • Softened predictions with uncertainty language")
                 
             else:
@@ -181,8 +603,8 @@ class InteractiveFinancialAdvisor:
                 print(f"{self.GREEN}{'=' * 50}{self.END}")
             
             # Save the advice automatically
-            final_advice = compliant_advice if hasattr(validation_result, 'error_message') else ai_advice
-            
+            final_advice = compliant_advice if is_fail else ai_advice
+
             # Ask if user wants to save
             save_choice = input("\n💾 Would you like to save this advice to a file? (y/n): ").strip().lower()
             if save_choice == 'y':
@@ -196,40 +618,54 @@ class InteractiveFinancialAdvisor:
     
     def _show_welcome(self):
         """Display welcome message and introduction."""
-        print(f"{self.CYAN}{'=' * 70}{self.END}")
-        print(f"{self.BOLD}{self.CYAN}🏦 AI FINANCIAL ADVISOR WITH COMPLIANCE VALIDATION{self.END}")
-        print(f"{self.CYAN}{'=' * 70}{self.END}")
-        print(f"\n{self.BOLD}Welcome! This tool provides AI-generated financial advice that is:{self.END}")
-        print(f"{self.GREEN}✅ Automatically validated for regulatory compliance{self.END}")
-        print(f"{self.GREEN}✅ Enhanced with required disclaimers and risk warnings{self.END}")
-        print(f"{self.GREEN}✅ Free from prohibited guarantee language{self.END}")
-        print(f"{self.GREEN}✅ Properly hedged with uncertainty language{self.END}")
-        print(f"\n{self.YELLOW}💡 How it works:{self.END}")
-        print("   1. You ask a financial question")
-        print("   2. AI generates advice")
-        print("   3. Validator ensures compliance")
-        print("   4. You receive safe, compliant advice")
+        print(self._WELCOME_TEXT)
     
+    def _get_multiline_input(self, prompt: str) -> str:
+        """Read multi-line content line by line.
+
+        input() keeps readline editing and history available; a lone '.'
+        (or Ctrl-D) ends the entry and the lines are joined once at the end
+        rather than concatenated incrementally.
+        """
+        try:
+            import readline  # noqa: F401 - enables line editing for input()
+        except ImportError:
+            pass
+        print(prompt)
+        print(f"{self.YELLOW}(Finish with a single '.' on its own line, or Ctrl-D){self.END}")
+        lines = []
+        while True:
+            try:
+                line = input()
+            except EOFError:
+                break
+            if line == '.':
+                break
+            lines.append(line)
+        return '\n'.join(lines).strip()
+
     def _validate_user_content(self):
         """Validate user-provided financial content."""
         print("\n📋 CONTENT VALIDATION")
         print("-" * 50)
-        print("Enter your financial content (or 'back' to return):")
-        
-        content = input(f"{self.YELLOW}> {self.END}").strip()
+
+        content = self._get_multiline_input("Enter your financial content (or 'back' to return):")
         if content.lower() == 'back':
             return
         
         print(f"\n{self.CYAN}🔍 Validating content...{self.END}")
-        result = self.validator._validate(content, {})
-        
-        if hasattr(result, 'error_message'):
+        # The validator's own stage-1 topic detection is the cheap gate
+        # here; a keyword prefilter on our side would have to mirror its
+        # full vocabulary exactly to be sound
+        result = self._validate_content(content)
+
+        if isinstance(result, FailResult):
             # Failed validation
             print(f"\n{self.RED}❌ VALIDATION FAILED{self.END}")
             print(f"{self.YELLOW}Issues found:{self.END}")
             print(f"  • {result.error_message}")
-            
-            if hasattr(result, 'fix_value') and result.fix_value:
+
+            if result.fix_value:
                 print(f"\n{self.GREEN}✨ Quick fix suggestion:{self.END}")
                 print(f"{self.GREEN}{'─' * 60}{self.END}")
                 print(f"{self.BOLD}{result.fix_value}{self.END}")
@@ -252,28 +688,17 @@ class InteractiveFinancialAdvisor:
         """Get user content and enhance it with AI for compliance."""
         print("\n🤖 AI-POWERED COMPLIANCE ENHANCEMENT")
         print("-" * 50)
-        print("Enter your financial content to enhance (or 'back' to return):")
-        
-        content = input(f"{self.YELLOW}> {self.END}").strip()
+
+        content = self._get_multiline_input("Enter your financial content to enhance (or 'back' to return):")
         if content.lower() == 'back':
             return
         
         self._enhance_content_with_llm(content)
     
-    def _enhance_content_with_llm(self, content: str, already_compliant: bool = False):
-        """Use LLM to enhance content with proper compliance elements."""
-        if not self.groq_client:
-            print("\n⚠️  Groq API key not found. Using rule-based enhancement instead.")
-            enhanced = self._rule_based_enhancement(content)
-            print("\n📝 Enhanced content (rule-based):")
-            print("-" * 50)
-            print(enhanced)
-            return
-        
-        print("\n🔄 Enhancing with AI...")
-        
+    def _build_enhancement_prompt(self, content: str, already_compliant: bool = False) -> str:
+        """Build the compliance-enhancement prompt for the given content."""
         if already_compliant:
-            prompt = f"""
+            return f"""
             The following financial content is already compliant but could be enhanced.
             Add any additional risk warnings, educational context, or professional language
             that would make it even better while maintaining the original message:
@@ -282,8 +707,7 @@ class InteractiveFinancialAdvisor:
 
             Enhance it to be more professional and comprehensive while keeping it concise.
             """
-        else:
-            prompt = f"""
+        return f"""
             Transform the following financial content to be fully compliant with SEC/FINRA regulations:
 
             "{content}"
@@ -298,27 +722,68 @@ class InteractiveFinancialAdvisor:
 
             Provide the enhanced version that is both compliant and maintains the intended message.
             """
+
+    def _enhance_content_with_llm(self, content: str, already_compliant: bool = False):
+        """Use LLM to enhance content with proper compliance elements."""
+        if not self.groq_api_key:
+            print("\n⚠️  Groq API key not found. Using rule-based enhancement instead.")
+            enhanced = self._rule_based_enhancement(content)
+            print("\n📝 Enhanced content (rule-based):")
+            print("-" * 50)
+            print(enhanced)
+            return
         
+        print("\n🔄 Enhancing with AI...")
+
+        prompt = self._build_enhancement_prompt(content, already_compliant)
+
+        # Identical content+mode pairs reuse their enhancement from a small
+        # on-disk cache instead of paying another LLM round-trip
+        cache_key = hashlib.sha256(f"{already_compliant}|{content}".encode()).hexdigest()
+        cache_file = self._enhance_cache_dir / f"{cache_key}.txt"
+
         try:
-            completion = self.groq_client.chat.completions.create(
-                model=self.groq_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=500
-            )
-            
-            enhanced_content = completion.choices[0].message.content.strip()
-            
-            print(f"\n{self.GREEN}✨ AI-ENHANCED COMPLIANT VERSION:{self.END}")
-            print(f"{self.GREEN}{'═' * 60}{self.END}")
-            print(f"{self.BOLD}{enhanced_content}{self.END}")
-            print(f"{self.GREEN}{'═' * 60}{self.END}")
+            if cache_file.is_file():
+                enhanced_content = cache_file.read_text()
+                print(f"\n{self.GREEN}⚡ Reusing cached enhancement{self.END}")
+                print(f"\n{self.GREEN}✨ AI-ENHANCED COMPLIANT VERSION:{self.END}")
+                print(f"{self.GREEN}{'═' * 60}{self.END}")
+                print(f"{self.BOLD}{enhanced_content}{self.END}")
+                print(f"{self.GREEN}{'═' * 60}{self.END}")
+            else:
+                # Stream the enhancement so tokens render as they arrive
+                # instead of after the full generation
+                self._get_groq_client()
+                stream = self._create_completion(
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=self._enhancement_budget(content, already_compliant),
+                    stream=True,
+                )
+                print(f"\n{self.GREEN}✨ AI-ENHANCED COMPLIANT VERSION:{self.END}")
+                print(f"{self.GREEN}{'═' * 60}{self.END}")
+                print(self.BOLD, end='')
+                buf = []
+                for chunk in stream:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        print(delta, end='', flush=True)
+                        buf.append(delta)
+                print(self.END)
+                print(f"{self.GREEN}{'═' * 60}{self.END}")
+                enhanced_content = ''.join(buf).strip()
+
+                try:
+                    self._enhance_cache_dir.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_text(enhanced_content)
+                except OSError:
+                    pass  # Cache persistence is best-effort
             
             # Validate the enhanced version
             print(f"\n{self.CYAN}🔍 Validating enhanced content...{self.END}")
-            validation_result = self.validator._validate(enhanced_content, {})
-            
-            if hasattr(validation_result, 'error_message'):
+            validation_result = self._validate_content(enhanced_content)
+
+            if isinstance(validation_result, FailResult):
                 print(f"{self.YELLOW}⚠️  Enhanced content still has issues. Applying additional fixes...{self.END}")
                 # Apply additional rule-based fixes
                 enhanced_content = self._rule_based_enhancement(enhanced_content)
@@ -344,32 +809,70 @@ class InteractiveFinancialAdvisor:
             print("\n📝 Enhanced content (rule-based):")
             print(enhanced)
     
+    # Fixed instructions for batched enhancement - sent once per request as
+    # the system message so the user message carries only the content
+    _ENHANCEMENT_SYSTEM_PROMPT = (
+        "Transform the financial content provided by the user to be fully "
+        "compliant with SEC/FINRA regulations: add appropriate disclaimers "
+        "(e.g. 'Not financial advice'), replace guaranteed return language "
+        "with uncertainty terms, soften specific predictions with words like "
+        "'might', 'could', 'potentially', include risk warnings where "
+        "appropriate, and suggest consulting professionals for serious "
+        "decisions. Maintain the core message while ensuring compliance, and "
+        "respond with only the enhanced version."
+    )
+
+    def _enhance_content_with_llm_batch(self, contents) -> list:
+        """Enhance several pieces of content concurrently.
+
+        Requests run on a small thread pool over the shared pooled HTTP
+        client; the fixed instructions ride in the system message so each
+        request's user message is just the content itself.
+        """
+        self._get_groq_client()
+
+        def enhance(content):
+            completion = self._create_completion(
+                messages=[
+                    {"role": "system", "content": self._ENHANCEMENT_SYSTEM_PROMPT},
+                    {"role": "user", "content": content},
+                ],
+                temperature=0.3,
+                max_tokens=self._enhancement_budget(content),
+            )
+            return completion.choices[0].message.content.strip()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return list(pool.map(enhance, contents))
+
+    def _has_disclaimer(self, text: str) -> bool:
+        """Detect a disclaimer in one automaton or alternation pass."""
+        if self._disclaimer_automaton is not None:
+            return next(self._disclaimer_automaton.iter(text.lower()), None) is not None
+        return self._disclaimer_re.search(text) is not None
+
     def _rule_based_enhancement(self, content: str) -> str:
         """Apply rule-based enhancements for compliance."""
-        enhanced = content
-        
-        # Soften guaranteed language first
-        enhanced = re.sub(r'\bguarantee[sd]?\b', 'potentially', enhanced, flags=re.IGNORECASE)
-        enhanced = re.sub(r'\bcannot lose\b', 'may have lower risk', enhanced, flags=re.IGNORECASE)
-        enhanced = re.sub(r'\brisk[- ]free\b', 'lower risk', enhanced, flags=re.IGNORECASE)
-        enhanced = re.sub(r'\bwill definitely\b', 'might', enhanced, flags=re.IGNORECASE)
-        
-        # Soften predictions
-        enhanced = re.sub(r'\bwill hit\b', 'could potentially reach', enhanced, flags=re.IGNORECASE)
-        enhanced = re.sub(r'\bwill be worth\b', 'might be valued at', enhanced, flags=re.IGNORECASE)
-        enhanced = re.sub(r'\bwill double\b', 'could potentially increase', enhanced, flags=re.IGNORECASE)
-        enhanced = re.sub(r'\bwill\b', 'might', enhanced, flags=re.IGNORECASE)
-        
-        # Check if it needs disclaimers - check both original and enhanced content
-        has_financial_terms = any(
-            keyword in enhanced.lower() 
-            for keyword in ['invest', 'stock', 'profit', 'money', 'buy', 'sell', 'trading', 'portfolio']
-        )
-        
-        has_disclaimer = any(
-            disclaimer in enhanced.lower() 
-            for disclaimer in self.validator.disclaimer_keywords
-        )
+        # Fast path: nothing needs softening and a disclaimer is already
+        # present, so the content comes back untouched
+        if _ALT.search(content) is None and self._has_disclaimer(content):
+            return content
+
+        # Soften guaranteed language and predictions in a single scan
+        enhanced = _ALT.sub(lambda m: _REPL[m.group(0).lower()], content)
+
+        # Check if it needs disclaimers - one automaton pass per keyword set
+        # (falls back to one compiled-alternation pass without pyahocorasick)
+        if self._fin_automaton is not None:
+            enhanced_lower = enhanced.lower()
+            has_financial_terms = next(self._fin_automaton.iter(enhanced_lower), None) is not None
+            has_disclaimer = next(self._disclaimer_automaton.iter(enhanced_lower), None) is not None
+        else:
+            has_financial_terms = self._fin_terms_re.search(enhanced) is not None
+            has_disclaimer = self._disclaimer_re.search(enhanced) is not None
+        # Advice language needs a disclaimer even without the financial terms
+        if not has_financial_terms and self._advice_re.search(enhanced):
+            has_financial_terms = True
         
         # Always add disclaimer if it's financial content without one
         if has_financial_terms and not has_disclaimer:
@@ -379,58 +882,117 @@ class InteractiveFinancialAdvisor:
     
     def _show_compliance_tips(self):
         """Display compliance tips."""
-        print("\n📚 FINANCIAL COMPLIANCE TIPS")
-        print("=" * 50)
-        for i, tip in enumerate(self.compliance_tips, 1):
-            print(f"{i}. {tip}")
-        
-        print("\n🎯 Key Principles:")
-        print("• Transparency: Be clear about risks and uncertainties")
-        print("• Humility: Avoid absolute statements about future performance")
-        print("• Education: Focus on informing rather than directing")
-        print("• Protection: Always encourage professional consultation")
-    
+        print(self._TIPS_TEXT)
+
     def _show_compliant_examples(self):
         """Show examples of compliant phrases."""
-        print("\n✅ COMPLIANT PHRASE EXAMPLES")
-        print("=" * 50)
-        
-        print("\n📌 Disclaimers:")
-        print(f"  • '{self.compliant_examples['disclaimer']}'")
-        print(f"  • '{self.compliant_examples['risk_warning']}'")
-        print(f"  • '{self.compliant_examples['educational']}'")
-        
-        print("\n📌 Uncertainty Language:")
-        print(f"  • Examples: {', '.join(self.compliant_examples['uncertainty'])}")
-        print("  • Instead of 'will' → use 'might', 'could', 'may'")
-        print("  • Instead of 'guaranteed' → use 'potential', 'possible'")
-        print("  • Instead of 'definitely' → use 'likely', 'probably'")
-        
-        print("\n📌 Professional References:")
-        print(f"  • '{self.compliant_examples['professional']}'")
-        print("  • 'Seek advice from a licensed investment advisor'")
-        print("  • 'Discuss with your financial planner'")
+        print(self._EXAMPLES_TEXT)
     
+    def _prefetch_sample_answers(self):
+        """Fetch and validate sample-question answers in the background.
+
+        Answers are served from a small on-disk cache when available so
+        subsequent launches never touch the network.
+        """
+        try:
+            with open(self._sample_cache_path) as f:
+                saved = json.load(f)
+            if all(q in saved for q in self.SAMPLE_QUESTIONS):
+                self._sample_cache = saved
+                return
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        try:
+            results = asyncio.run(self._fetch_samples_async())
+        except Exception:
+            return  # Best-effort warm-up; the demo falls back to static text
+
+        # A quiet validator keeps the per-stage progress output from
+        # interleaving with the interactive menu mid-session
+        quiet_validator = FinancialComplianceValidator(
+            verbose=False, **self._validator_config)
+
+        cache = {}
+        for question, advice in zip(self.SAMPLE_QUESTIONS, results):
+            result = self._validate_content(advice, validator=quiet_validator)
+            entry = {"advice": advice, "compliant": not isinstance(result, FailResult)}
+            if isinstance(result, FailResult):
+                entry["issues"] = result.error_message
+                entry["fix"] = result.fix_value or self._rule_based_enhancement(advice)
+            cache[question] = entry
+        self._sample_cache = cache
+
+        try:
+            self._sample_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._sample_cache_path, 'w') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+
+    async def _fetch_samples_async(self):
+        """Issue all sample-question completions concurrently.
+
+        Runs on the prefetch thread's own event loop, so it builds and
+        closes a client of its own rather than touching the shared one,
+        whose connection pool belongs to the main session loop.
+        """
+        import httpx
+        from groq import AsyncGroq
+        http_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, retries=2),
+            timeout=self._HTTP_TIMEOUT,
+            limits=httpx.Limits(**self._HTTP_LIMITS),
+        )
+        client = AsyncGroq(api_key=self.groq_api_key, http_client=http_client)
+
+        async def ask(question):
+            prompt = f"""You are a financial advisor. Answer this question: {question}
+
+        Provide helpful financial advice but be specific and actionable."""
+            completion = await client.chat.completions.create(
+                model=self.groq_model,
+                max_tokens=500,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7,
+            )
+            return completion.choices[0].message.content.strip()
+
+        try:
+            return await asyncio.gather(*(ask(q) for q in self.SAMPLE_QUESTIONS))
+        finally:
+            await client.close()
+
     def _test_sample_questions(self):
         """Test with sample financial questions."""
         print("\n🧪 SAMPLE QUESTIONS & AI RESPONSES")
         print("=" * 50)
-        
-        sample_questions = [
-            "Should I invest all my savings in Tesla stock?",
-            "What's a guaranteed way to double my money?",
-            "Is cryptocurrency a good investment for retirement?",
-            "Should I buy or rent a house in this market?",
-            "How can I get rich quickly with stocks?"
-        ]
-        
+
         print("\nExample questions you can ask:")
-        for i, question in enumerate(sample_questions, 1):
+        for i, question in enumerate(self.SAMPLE_QUESTIONS, 1):
             print(f"{i}. {question}")
-        
+
         print("\n💡 These questions will generate AI advice that gets validated for compliance.")
         print("   Try option 1 to ask your own questions!")
-        
+
+        # Show real pre-validated answers when the background prefetch has
+        # finished; otherwise fall back to the static walkthrough below
+        if self._sample_cache:
+            for i, question in enumerate(self.SAMPLE_QUESTIONS, 1):
+                entry = self._sample_cache.get(question)
+                if not entry:
+                    continue
+                print("\n" + "-" * 50)
+                print(f"Question {i}: {question}")
+                if entry["compliant"]:
+                    print(f"{self.GREEN}✅ Compliant advice:{self.END}")
+                    print(f"   {entry['advice'][:200]}")
+                else:
+                    print(f"{self.YELLOW}⚠️  Issues: {entry['issues'][:120]}{self.END}")
+                    print(f"{self.GREEN}✨ Compliant version:{self.END}")
+                    print(f"   {entry['fix'][:200]}")
+            return
+
         # Show a demo of what happens
         print("\n" + "-" * 50)
         print("DEMO: What happens when you ask a question:")
@@ -444,13 +1006,17 @@ class InteractiveFinancialAdvisor:
     
     def _save_to_file(self, content: str):
         """Save content to a file."""
-        filename = input("Enter filename (default: compliant_content.txt): ").strip()
-        if not filename:
-            filename = "compliant_content.txt"
-        
+        filename = input("Enter filename (default: compliant_content.txt): ").strip() or "compliant_content.txt"
+
         try:
-            with open(filename, 'w') as f:
-                f.write(content)
+            # Write the payload (binary mode, one encode + one buffered
+            # write) to a temp file beside the target, then rename it into
+            # place so readers never observe a partially written file
+            directory = os.path.dirname(os.path.abspath(filename))
+            with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as f:
+                f.write(content.encode('utf-8'))
+                tmp_name = f.name
+            os.replace(tmp_name, filename)
             print(f"✅ Saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving file: {e}")
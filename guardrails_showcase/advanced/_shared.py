@@ -0,0 +1,151 @@
+"""Shared scanning engine for the advanced text validators.
+
+logical_fallacy_detection and psychological_manipulation each run dozens
+of category patterns per text. PatternScanner compiles one engine per
+pattern database so a single call replaces N separate regex scans.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Optional Hyperscan engine for vectorized multi-pattern prefiltering
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Optional RE2 engine: a linear-time DFA with no backtracking, so the
+# .+ patterns stay O(N) even on adversarial input
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+class PatternScanner:
+    """One compiled multi-pattern engine over a {category: [patterns]} db.
+
+    The patterns are fused into a single named-group alternation; each
+    branch is named <category>__<index> and inner capture groups are made
+    non-capturing so m.lastgroup always names the matching branch. When
+    Hyperscan is installed, a SIMD single-match database over the same
+    branches acts as a cheap prefilter that decides whether the
+    attributing re scan needs to run at all.
+
+    Callers pass already-lowercased text; the patterns are lowercase
+    ASCII, so no engine needs to case-fold a second time.
+    """
+
+    def __init__(self, patterns_by_category: Dict[str, List[str]]):
+        branches = [
+            f"(?P<{category}__{i}>{pattern.replace('(', '(?:')})"
+            for category, patterns in patterns_by_category.items()
+            for i, pattern in enumerate(patterns)
+        ]
+        self._re = re.compile("|".join(branches))
+
+        self._hs_db = None
+        if HYPERSCAN_AVAILABLE:
+            try:
+                expressions = [
+                    pattern.replace('(', '(?:').encode()
+                    for patterns in patterns_by_category.values()
+                    for pattern in patterns
+                ]
+                db = hyperscan.Database()
+                db.compile(expressions=expressions,
+                           flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions))
+                self._hs_db = db
+            except hyperscan.error:
+                self._hs_db = None  # Unsupported construct; use the re path only
+
+        # RE2's multi-pattern Set fills the prefilter role when Hyperscan
+        # is absent; its DFA never backtracks
+        self._re2_set = None
+        if self._hs_db is None and RE2_AVAILABLE:
+            try:
+                pattern_set = re2.Set.SearchSet()
+                for patterns in patterns_by_category.values():
+                    for pattern in patterns:
+                        pattern_set.Add(pattern)
+                pattern_set.Compile()
+                self._re2_set = pattern_set
+            except Exception:
+                self._re2_set = None  # Unsupported construct; use the re path only
+
+    def any(self, text: str) -> bool:
+        """True if any pattern matches, using the fastest available engine."""
+        if self._hs_db is not None:
+            # Returning nonzero from the handler halts the scan, which
+            # python-hyperscan surfaces as ScanTerminated - i.e. a hit
+            try:
+                self._hs_db.scan(text.encode(), match_event_handler=lambda *_: 1)
+            except hyperscan.ScanTerminated:
+                return True
+            return False
+        if self._re2_set is not None:
+            return bool(self._re2_set.Match(text))
+        return self._re.search(text) is not None
+
+    def iter_matches(self, text: str):
+        """Yield (category, snippet) pairs lazily for early-exit callers."""
+        if (self._hs_db is not None or self._re2_set is not None) and not self.any(text):
+            return
+        for m in self._re.finditer(text):
+            yield m.lastgroup.split("__")[0], m.group(0)
+
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """Return {category: [matched snippets]} for all hits in the text."""
+        hits: Dict[str, List[str]] = {}
+        for category, snippet in self.iter_matches(text):
+            hits.setdefault(category, []).append(snippet)
+        return hits
+
+
+# Word tallies common to both validators, one linear scan each
+EMOTIONAL_RE = re.compile(r'\b(?:outrageous|ridiculous|absurd|insane|crazy|stupid)\b')
+ABSOLUTE_RE = re.compile(r'\b(?:always|never|all|none|every|completely|totally)\b')
+
+
+@dataclass
+class TextFeatures:
+    """Per-text analysis computed once and shared across validators.
+
+    hits is only filled when analyze() was given a scanner; validators
+    fall back to their own scan when it is None.
+    """
+    text_lower: str
+    emotional_count: int
+    absolute_count: int
+    hits: Optional[Dict[str, List[str]]] = None
+
+
+def analyze(text: str, scanner: Optional[PatternScanner] = None) -> TextFeatures:
+    """Lower the text and compute the shared word tallies in one pass each."""
+    text_lower = text.lower()
+    return TextFeatures(
+        text_lower=text_lower,
+        emotional_count=len(EMOTIONAL_RE.findall(text_lower)),
+        absolute_count=len(ABSOLUTE_RE.findall(text_lower)),
+        hits=scanner.scan(text_lower) if scanner is not None else None,
+    )
+
+
+class Pipeline:
+    """Chain several guards over one text, analyzing it only once.
+
+    Each guard still applies its own pattern database, but the lowering
+    and shared word tallies are computed a single time up front.
+    """
+
+    def __init__(self, guards):
+        self.guards = list(guards)
+
+    def validate(self, value: str) -> str:
+        features = analyze(value)
+        for guard in self.guards:
+            value = guard.validate(value, features=features)
+        return value
@@ -1,11 +1,84 @@
+import asyncio
+import ipaddress
 import re
 import socket
+import time
 import requests
+from functools import lru_cache, partial
 from urllib.parse import urlparse
 from typing import Dict, Any, List
 import validators
 from guardrails.errors import ValidationError
 
+# dnspython is optional - resolve the import once at module load instead of
+# retrying (and swallowing ImportError) on every MX check
+try:
+    import dns.resolver as _dns_resolver
+except ImportError:
+    _dns_resolver = None
+
+# Optional async stack for batched network checks
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# DNS verdicts are cached briefly so repeated validations of the same
+# domain don't re-query the resolver within the TTL window
+_DNS_CACHE_TTL = 300.0
+_dns_cache: Dict[str, tuple] = {}
+
+
+def _resolves(domain: str) -> bool:
+    """Check (with a short-lived cache) whether a domain resolves."""
+    now = time.monotonic()
+    cached = _dns_cache.get(domain)
+    if cached is not None and now - cached[1] < _DNS_CACHE_TTL:
+        return cached[0]
+    try:
+        socket.gethostbyname(domain)
+        ok = True
+    except socket.gaierror:
+        ok = False
+    _dns_cache[domain] = (ok, now)
+    return ok
+
+
+# Shared session for reachability probes: connections stay warm between
+# checks and the widened pool absorbs batched validations
+_HTTP = requests.Session()
+_HTTP.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=64))
+_HTTP.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=64))
+
+
+def _fold(s: str) -> str:
+    """Lowercase only when needed - already-folded input skips the copy."""
+    return s if s.islower() else s.lower()
+
+
+# validators.* re-runs a stack of regexes on every call; format validity is
+# a pure function of the string, so memoize the verdicts across validations
+@lru_cache(maxsize=4096)
+def _url_ok(value: str) -> bool:
+    return bool(validators.url(value))
+
+
+@lru_cache(maxsize=4096)
+def _domain_ok(value: str) -> bool:
+    return bool(validators.domain(value))
+
+
+@lru_cache(maxsize=4096)
+def _email_ok(value: str) -> bool:
+    return bool(validators.email(value))
+
 
 def url_validator(value: str, allowed_schemes: List[str] = None, 
                  blocked_domains: List[str] = None, check_reachability: bool = False) -> str:
@@ -15,7 +88,7 @@ def url_validator(value: str, allowed_schemes: List[str] = None,
     blocked_domains = blocked_domains or []
     
     # Basic URL validation
-    if not validators.url(value):
+    if not _url_ok(value):
         raise ValidationError(f"Invalid URL format: {value}")
     
     # Parse URL
@@ -28,16 +101,23 @@ def url_validator(value: str, allowed_schemes: List[str] = None,
             f"Allowed schemes: {allowed_schemes}"
         )
     
-    # Check blocked domains
-    domain = parsed.netloc.lower()
-    for blocked in blocked_domains:
-        if blocked.lower() in domain:
-            raise ValidationError(f"Domain '{domain}' is blocked")
+    # Check blocked domains by exact label suffix: 'malicious.com' blocks
+    # the domain itself and any subdomain without the substring false
+    # positives of the old scan (e.g. 'notmalicious.com'). One set lookup
+    # per label beats one substring scan per blocklist entry.
+    if blocked_domains:
+        if not isinstance(blocked_domains, frozenset):
+            blocked_domains = frozenset(d.lower() for d in blocked_domains)
+        host = _fold(parsed.netloc).split(':')[0]
+        labels = host.split('.')
+        for i in range(len(labels)):
+            if '.'.join(labels[i:]) in blocked_domains:
+                raise ValidationError(f"Domain '{host}' is blocked")
     
     # Check reachability
     if check_reachability:
         try:
-            response = requests.head(value, timeout=5, allow_redirects=True)
+            response = _HTTP.head(value, timeout=5, allow_redirects=True)
             if response.status_code >= 400:
                 raise ValidationError(f"URL not reachable (status: {response.status_code})")
         except requests.RequestException as e:
@@ -46,42 +126,43 @@ def url_validator(value: str, allowed_schemes: List[str] = None,
     return value
 
 
-def ip_address_validator(value: str, allow_private: bool = False, 
+def ip_address_validator(value: str, allow_private: bool = False,
                         allow_localhost: bool = True, version: int = None) -> str:
     """Validator function for IP address validation"""
     value = value.strip()
-    
-    # Validate IP format
-    is_valid_ipv4 = validators.ipv4(value)
-    is_valid_ipv6 = validators.ipv6(value)
-    
-    if not (is_valid_ipv4 or is_valid_ipv6):
+
+    # Parse once: a single ip_address() call yields format validity, the
+    # version, and the private/loopback flags that previously needed two
+    # validators regex passes plus separate helper lookups
+    try:
+        ip_obj = ipaddress.ip_address(value)
+    except ValueError:
         raise ValidationError(f"Invalid IP address format: {value}")
-    
+
     # Check version restriction
-    if version == 4 and not is_valid_ipv4:
+    if version == 4 and ip_obj.version != 4:
         raise ValidationError(f"Only IPv4 addresses allowed: {value}")
-    elif version == 6 and not is_valid_ipv6:
+    elif version == 6 and ip_obj.version != 6:
         raise ValidationError(f"Only IPv6 addresses allowed: {value}")
-    
+
     # Check private IP
-    if not allow_private and _is_private_ip(value):
+    if not allow_private and ip_obj.is_private:
         raise ValidationError(f"Private IP addresses not allowed: {value}")
-    
+
     # Check localhost
-    if not allow_localhost and _is_localhost(value):
+    if not allow_localhost and ip_obj.is_loopback:
         raise ValidationError(f"Localhost addresses not allowed: {value}")
-    
+
     return value
 
 
 def domain_validator(value: str, check_dns: bool = False, 
                     allowed_tlds: List[str] = None, min_length: int = 3) -> str:
     """Validator function for domain validation"""
-    value = value.strip().lower()
+    value = _fold(value.strip())
     
     # Basic domain validation
-    if not validators.domain(value):
+    if not _domain_ok(value):
         raise ValidationError(f"Invalid domain format: {value}")
     
     # Check minimum length
@@ -98,11 +179,8 @@ def domain_validator(value: str, check_dns: bool = False,
             )
     
     # DNS lookup
-    if check_dns:
-        try:
-            socket.gethostbyname(value)
-        except socket.gaierror:
-            raise ValidationError(f"Domain does not resolve: {value}")
+    if check_dns and not _resolves(value):
+        raise ValidationError(f"Domain does not resolve: {value}")
     
     return value
 
@@ -110,12 +188,12 @@ def domain_validator(value: str, check_dns: bool = False,
 def email_domain_validator(value: str, allowed_domains: List[str] = None, 
                           blocked_domains: List[str] = None, check_mx: bool = False) -> str:
     """Validator function for email domain validation"""
-    value = value.strip().lower()
+    value = _fold(value.strip())
     allowed_domains = allowed_domains or []
     blocked_domains = blocked_domains or []
     
     # Basic email validation
-    if not validators.email(value):
+    if not _email_ok(value):
         raise ValidationError(f"Invalid email format: {value}")
     
     # Extract domain
@@ -125,69 +203,172 @@ def email_domain_validator(value: str, allowed_domains: List[str] = None,
     if allowed_domains and domain not in allowed_domains:
         raise ValidationError(
             f"Email domain '{domain}' not allowed. "
-            f"Allowed domains: {allowed_domains}"
+            f"Allowed domains: {sorted(allowed_domains)}"
         )
     
     # Check blocked domains
     if domain in blocked_domains:
         raise ValidationError(f"Email domain '{domain}' is blocked")
     
-    # Check MX record (simplified)
-    if check_mx:
+    # Check MX record (simplified; skipped when dnspython is unavailable)
+    if check_mx and _dns_resolver is not None:
         try:
-            import dns.resolver
-            mx_records = dns.resolver.resolve(domain, 'MX')
+            mx_records = _dns_resolver.resolve(domain, 'MX')
             if not mx_records:
                 raise ValidationError(f"No MX record found for domain: {domain}")
-        except ImportError:
-            # dnspython not available, skip MX check
-            pass
         except Exception as e:
             raise ValidationError(f"MX record check failed for {domain}: {str(e)}")
     
     return value
 
 
+@lru_cache(maxsize=4096)
 def _is_private_ip(ip: str) -> bool:
     """Check if IP is in private range"""
-    import ipaddress
     try:
         ip_obj = ipaddress.ip_address(ip)
         return ip_obj.is_private
-    except:
+    except ValueError:
         return False
 
 
+@lru_cache(maxsize=4096)
 def _is_localhost(ip: str) -> bool:
     """Check if IP is localhost"""
-    localhost_patterns = ['127.', '::1', 'localhost']
-    return any(pattern in ip.lower() for pattern in localhost_patterns)
+    try:
+        # Covers the whole 127.0.0.0/8 range and ::1 without the substring
+        # false positives of the old pattern scan (e.g. '1.127.0.1')
+        return ipaddress.ip_address(ip).is_loopback
+    except ValueError:
+        return ip.lower() == 'localhost'
+
+
+# Validator dispatch for InfrastructureGuard - a dict lookup replaces the
+# per-call if/elif chain
+_DISPATCH = {
+    'url': url_validator,
+    'ip': ip_address_validator,
+    'domain': domain_validator,
+    'email_domain': email_domain_validator,
+}
 
 
 class InfrastructureGuard:
     """Simple guardrail for infrastructure validation"""
-    
+
     def __init__(self, validator_type: str, **kwargs):
         self.validator_type = validator_type
-        self.kwargs = kwargs
-        
+
         # Validate validator type
-        valid_types = ['url', 'ip', 'domain', 'email_domain']
-        if validator_type not in valid_types:
-            raise ValueError(f"Unknown validator type: {validator_type}")
-    
+        try:
+            validator_fn = _DISPATCH[validator_type]
+        except KeyError:
+            raise ValueError(f"Unknown validator type: {validator_type}") from None
+
+        # Normalize domain lists once at construction so validate() never
+        # re-lowercases them; email domain checks become frozenset lookups
+        if kwargs.get('blocked_domains'):
+            kwargs['blocked_domains'] = frozenset(d.lower() for d in kwargs['blocked_domains'])
+        if kwargs.get('allowed_domains'):
+            kwargs['allowed_domains'] = frozenset(d.lower() for d in kwargs['allowed_domains'])
+        self.kwargs = kwargs
+
+        # Bind the validator and its options once; validate() is a plain call
+        self._fn = partial(validator_fn, **kwargs)
+
     def validate(self, value: str) -> str:
         """Validate the input text"""
-        if self.validator_type == 'url':
-            return url_validator(value, **self.kwargs)
-        elif self.validator_type == 'ip':
-            return ip_address_validator(value, **self.kwargs)
-        elif self.validator_type == 'domain':
-            return domain_validator(value, **self.kwargs)
-        elif self.validator_type == 'email_domain':
-            return email_domain_validator(value, **self.kwargs)
-        else:
-            raise ValueError(f"Unknown validator type: {self.validator_type}")
+        return self._fn(value)
+
+    def validate_batch(self, values: List[str]) -> List[Dict[str, Any]]:
+        """Validate many values, overlapping any network checks.
+
+        URL reachability probes (aiohttp) and domain DNS lookups (aiodns)
+        are issued concurrently when the async libraries are installed;
+        other configurations fall back to sequential validate() calls.
+        """
+        if (self.validator_type == 'url' and self.kwargs.get('check_reachability')
+                and AIOHTTP_AVAILABLE):
+            return asyncio.run(self._validate_urls_async(values))
+        if (self.validator_type == 'domain' and self.kwargs.get('check_dns')
+                and AIODNS_AVAILABLE):
+            return asyncio.run(self._validate_domains_async(values))
+
+        results = []
+        for value in values:
+            try:
+                results.append({"input": value, "status": "PASSED", "output": self.validate(value)})
+            except Exception as e:
+                results.append({"input": value, "status": "FAILED", "reason": str(e)})
+        return results
+
+    async def _validate_urls_async(self, values: List[str]) -> List[Dict[str, Any]]:
+        """Offline URL checks first, then concurrent reachability probes."""
+        offline_kwargs = dict(self.kwargs, check_reachability=False)
+        results = []
+        to_probe = []
+        for value in values:
+            try:
+                validated = url_validator(value, **offline_kwargs)
+            except Exception as e:
+                results.append({"input": value, "status": "FAILED", "reason": str(e)})
+                continue
+            entry = {"input": value, "status": "PASSED", "output": validated}
+            results.append(entry)
+            to_probe.append(entry)
+
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            async def probe(entry):
+                try:
+                    async with session.head(entry["output"], allow_redirects=True) as response:
+                        if response.status >= 400:
+                            entry.pop("output", None)
+                            entry.update(status="FAILED",
+                                         reason=f"URL not reachable (status: {response.status})")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # ClientTimeout surfaces as asyncio.TimeoutError, not
+                    # a ClientError subclass
+                    entry.pop("output", None)
+                    entry.update(status="FAILED", reason=f"URL not reachable: {e}")
+
+            await asyncio.gather(*(probe(entry) for entry in to_probe))
+        return results
+
+    async def _validate_domains_async(self, values: List[str]) -> List[Dict[str, Any]]:
+        """Offline domain checks first, then concurrent DNS resolution."""
+        offline_kwargs = dict(self.kwargs, check_dns=False)
+        results = []
+        to_resolve = []
+        for value in values:
+            try:
+                validated = domain_validator(value, **offline_kwargs)
+            except Exception as e:
+                results.append({"input": value, "status": "FAILED", "reason": str(e)})
+                continue
+            entry = {"input": value, "status": "PASSED", "output": validated}
+            results.append(entry)
+            to_resolve.append(entry)
+
+        resolver = aiodns.DNSResolver()
+
+        async def resolve(entry):
+            domain = entry["output"]
+            cached = _dns_cache.get(domain)
+            if cached is not None and time.monotonic() - cached[1] < _DNS_CACHE_TTL:
+                ok = cached[0]
+            else:
+                try:
+                    await resolver.query(domain, 'A')
+                    ok = True
+                except Exception:
+                    ok = False
+                _dns_cache[domain] = (ok, time.monotonic())
+            if not ok:
+                entry.pop("output")
+                entry.update(status="FAILED", reason=f"Domain does not resolve: {domain}")
+
+        await asyncio.gather(*(resolve(entry) for entry in to_resolve))
+        return results
 
 
 def create_infrastructure_guard(validator_type: str, **kwargs) -> InfrastructureGuard:
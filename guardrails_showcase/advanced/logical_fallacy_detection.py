@@ -1,98 +1,140 @@
+import asyncio
+import json
 import os
 import re
-from typing import List, Dict, Any
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 import requests
 from guardrails.errors import ValidationError
 
-load_dotenv()
+# Optional async HTTP client for concurrent LLM calls
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
+# Optional SIMD JSON parser for decoding Groq responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def logical_fallacy_validator(value: str, use_llm: bool = True, 
-                             require_structure: bool = False) -> str:
+# Optional Aho-Corasick automatons collapse each multi-keyword scan
+# into a single linear pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional semantic cache so near-duplicate texts reuse LLM verdicts
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+from guardrails_showcase.advanced._shared import PatternScanner, TextFeatures, analyze
+
+# Only pay for .env parsing when the key is not already exported, and
+# resolve it once at import instead of per LLM call
+if not os.getenv("GROQ_API_KEY"):
+    load_dotenv()
+_GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+
+# Pattern-based detection for common logical fallacies
+_FALLACY_PATTERNS = {
+    "ad_hominem": [
+        r"\b(you are|you're) (stupid|dumb|ignorant|crazy|wrong)\b",
+        r"\bonly (idiots|fools) (believe|think|say)\b",
+        r"\b(he|she|they) (can't be trusted|is lying|is biased)\b"
+    ],
+    "straw_man": [
+        r"\bso you're saying\b",
+        r"\byou (think|believe) that all\b",
+        r"\baccording to your logic\b"
+    ],
+    "false_dilemma": [
+        r"\b(either|if not).+(or|then).+(no other|only two|must choose)\b",
+        r"\byou're either (with us or against us|part of|not part of)\b",
+        r"\bthere are only two (options|choices|ways)\b"
+    ],
+    "appeal_to_authority": [
+        r"\b(all|most) (experts|scientists|doctors) (say|agree|believe)\b",
+        r"\b(famous|well-known) (people|celebrities) (endorse|support)\b",
+        r"\bif it's good enough for.+it's good enough\b"
+    ],
+    "bandwagon": [
+        r"\b(everyone|everybody) (is doing|believes|knows)\b",
+        r"\bmillions of people can't be wrong\b",
+        r"\ball the cool kids\b",
+        r"\bdon't be the only one\b"
+    ],
+    "circular_reasoning": [
+        r"\bbecause (it is|that's how|that's what)\b",
+        r"\bit's true because.+says so\b",
+        r"\bthe bible says.+because.+bible\b"
+    ],
+    "slippery_slope": [
+        r"\bif we (allow|permit|let).+then (eventually|soon|next)\b",
+        r"\bthis will lead to\b",
+        r"\bonce we start.+where does it end\b",
+        r"\bgive them an inch.+take a mile\b"
+    ],
+    "hasty_generalization": [
+        r"\ball (men|women|people|politicians) are\b",
+        r"\bevery (single|one of) them\b",
+        r"\bthey always\b",
+        r"\bnever trust a\b"
+    ]
+}
+
+
+# One engine scans all fallacy categories in a single pass
+_FALLACY_SCANNER = PatternScanner(_FALLACY_PATTERNS)
+
+
+def logical_fallacy_validator(value: str, use_llm: bool = True,
+                             require_structure: bool = False,
+                             llm_score: int = 0,
+                             features: Optional[TextFeatures] = None) -> str:
     """Validator function that detects logical fallacies"""
-    
-    # Pattern-based detection for common logical fallacies
-    fallacy_patterns = {
-        "ad_hominem": [
-            r"\b(you are|you're) (stupid|dumb|ignorant|crazy|wrong)\b",
-            r"\bonly (idiots|fools) (believe|think|say)\b",
-            r"\b(he|she|they) (can't be trusted|is lying|is biased)\b"
-        ],
-        "straw_man": [
-            r"\bso you're saying\b",
-            r"\byou (think|believe) that all\b",
-            r"\baccording to your logic\b"
-        ],
-        "false_dilemma": [
-            r"\b(either|if not).+(or|then).+(no other|only two|must choose)\b",
-            r"\byou're either (with us or against us|part of|not part of)\b",
-            r"\bthere are only two (options|choices|ways)\b"
-        ],
-        "appeal_to_authority": [
-            r"\b(all|most) (experts|scientists|doctors) (say|agree|believe)\b",
-            r"\b(famous|well-known) (people|celebrities) (endorse|support)\b",
-            r"\bif it's good enough for.+it's good enough\b"
-        ],
-        "bandwagon": [
-            r"\b(everyone|everybody) (is doing|believes|knows)\b",
-            r"\bmillions of people can't be wrong\b",
-            r"\ball the cool kids\b",
-            r"\bdon't be the only one\b"
-        ],
-        "circular_reasoning": [
-            r"\bbecause (it is|that's how|that's what)\b",
-            r"\bit's true because.+says so\b",
-            r"\bthe bible says.+because.+bible\b"
-        ],
-        "slippery_slope": [
-            r"\bif we (allow|permit|let).+then (eventually|soon|next)\b",
-            r"\bthis will lead to\b",
-            r"\bonce we start.+where does it end\b",
-            r"\bgive them an inch.+take a mile\b"
-        ],
-        "hasty_generalization": [
-            r"\ball (men|women|people|politicians) are\b",
-            r"\bevery (single|one of) them\b",
-            r"\bthey always\b",
-            r"\bnever trust a\b"
-        ]
-    }
-    
-    # Detect fallacy patterns using regex
-    detected = {}
-    text_lower = value.lower()
-    
-    for fallacy, patterns in fallacy_patterns.items():
-        matches = []
-        for pattern in patterns:
-            found = re.findall(pattern, text_lower, re.IGNORECASE)
-            if found:
-                matches.extend([str(match) for match in found])
-        if matches:
-            detected[fallacy] = matches
-    
-    # Calculate fallacy score
+
+    # Shared features (lowering and word tallies) may arrive precomputed
+    # from a pipeline that chains several guards over the same text
+    if features is None:
+        features = analyze(value, _FALLACY_SCANNER)
+    text_lower = features.text_lower
+
+    # Detect fallacy patterns in one streamed scan, stopping as soon as
+    # the blocking threshold is already guaranteed
+    if features.hits is not None:
+        matches_iter = ((cat, m) for cat, ms in features.hits.items() for m in ms)
+    else:
+        matches_iter = _FALLACY_SCANNER.iter_matches(text_lower)
+
     fallacy_score = 0
     detected_fallacies = []
-    
-    # Score based on pattern matches
-    for fallacy, matches in detected.items():
-        fallacy_score += len(matches) * 2
-        detected_fallacies.extend([f"{fallacy.replace('_', ' ')}: {match}" for match in matches])
+    for fallacy, match in matches_iter:
+        fallacy_score += 2
+        detected_fallacies.append(f"{fallacy.replace('_', ' ')}: {match}")
+        if fallacy_score >= 3 or len(detected_fallacies) >= 2:
+            break
     
     # Additional checks for specific fallacy indicators
     # Check for excessive emotional language
-    emotional_words = ['outrageous', 'ridiculous', 'absurd', 'insane', 'crazy', 'stupid']
-    emotional_count = sum(1 for word in emotional_words if word in text_lower)
-    if emotional_count >= 2:
+    if features.emotional_count >= 2:
         fallacy_score += 1
         detected_fallacies.append("appeal to emotion: excessive emotional language")
-    
+
     # Check for absolute statements
-    absolute_words = ['always', 'never', 'all', 'none', 'every', 'completely', 'totally']
-    absolute_count = sum(1 for word in absolute_words if f' {word} ' in f' {text_lower} ')
-    if absolute_count >= 2:
+    if features.absolute_count >= 2:
         fallacy_score += 1
         detected_fallacies.append("hasty generalization: absolute statements")
     
@@ -103,14 +145,15 @@ def logical_fallacy_validator(value: str, use_llm: bool = True,
             fallacy_score += len(structure_issues)
             detected_fallacies.extend([f"structure: {issue}" for issue in structure_issues])
     
-    # LLM-based analysis (optional, if Groq API key is available)
-    if use_llm and os.getenv("GROQ_API_KEY"):
+    # LLM-based analysis (optional, if Groq API key is available); batch
+    # callers pass a pre-computed llm_score instead
+    fallacy_score += llm_score
+    if use_llm and _GROQ_API_KEY:
         try:
-            llm_score = _llm_fallacy_analysis(value)
-            fallacy_score += llm_score
+            fallacy_score += _llm_fallacy_analysis(value)
         except Exception:
             pass  # Continue without LLM if there's an error
-    
+
     # If high fallacy score, block the content
     if fallacy_score >= 3 or len(detected_fallacies) >= 2:
         raise ValidationError(
@@ -121,37 +164,65 @@ def logical_fallacy_validator(value: str, use_llm: bool = True,
     return value
 
 
+# Indicators of logical structure, frozen once at module scope so each
+# _check_argument_structure call allocates no throwaway lists
+_PREMISE_INDICATORS = frozenset({
+    'because', 'since', 'given that', 'as', 'for', 'due to',
+    'owing to', 'seeing that', 'in view of', 'considering'
+})
+
+_CONCLUSION_INDICATORS = frozenset({
+    'therefore', 'thus', 'hence', 'so', 'consequently',
+    'it follows that', 'we can conclude', 'this means',
+    'as a result', 'accordingly'
+})
+
+_EVIDENCE_INDICATORS = frozenset({
+    'studies show', 'research indicates', 'data suggests',
+    'according to', 'statistics reveal', 'evidence shows',
+    'for example', 'specifically', 'in particular'
+})
+
+
+def _build_automaton(keywords):
+    """Build an automaton over the keywords, or None when unavailable."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _has_any(automaton, keywords, text: str) -> bool:
+    """True if any keyword occurs in the text, short-circuiting early."""
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return any(keyword in text for keyword in keywords)
+
+
+_PREMISE_AC = _build_automaton(_PREMISE_INDICATORS)
+_CONCLUSION_AC = _build_automaton(_CONCLUSION_INDICATORS)
+_EVIDENCE_AC = _build_automaton(_EVIDENCE_INDICATORS)
+
+# A run of terminators ("No!!!") ends one sentence, not three
+_TERMINATOR_RUN_RE = re.compile(r'[.!?]+')
+
+
 def _check_argument_structure(text: str) -> List[str]:
     """Check for proper argument structure"""
     text_lower = text.lower()
     issues = []
-    
-    # Indicators of logical structure
-    premise_indicators = [
-        'because', 'since', 'given that', 'as', 'for', 'due to',
-        'owing to', 'seeing that', 'in view of', 'considering'
-    ]
-    
-    conclusion_indicators = [
-        'therefore', 'thus', 'hence', 'so', 'consequently',
-        'it follows that', 'we can conclude', 'this means',
-        'as a result', 'accordingly'
-    ]
-    
-    evidence_indicators = [
-        'studies show', 'research indicates', 'data suggests',
-        'according to', 'statistics reveal', 'evidence shows',
-        'for example', 'specifically', 'in particular'
-    ]
-    
+
     # Check for premise indicators
-    has_premises = any(indicator in text_lower for indicator in premise_indicators)
-    
+    has_premises = _has_any(_PREMISE_AC, _PREMISE_INDICATORS, text_lower)
+
     # Check for conclusion indicators
-    has_conclusions = any(indicator in text_lower for indicator in conclusion_indicators)
-    
+    has_conclusions = _has_any(_CONCLUSION_AC, _CONCLUSION_INDICATORS, text_lower)
+
     # Check for evidence
-    has_evidence = any(indicator in text_lower for indicator in evidence_indicators)
+    has_evidence = _has_any(_EVIDENCE_AC, _EVIDENCE_INDICATORS, text_lower)
     
     # Validate argument structure
     if not has_premises:
@@ -163,23 +234,122 @@ def _check_argument_structure(text: str) -> List[str]:
     if not has_evidence:
         issues.append("lacks supporting evidence")
     
-    # Check for proper argument length (avoid one-liners)
-    sentences = re.split(r'[.!?]+', text.strip())
-    if len([s for s in sentences if s.strip()]) < 2:
+    # Check for proper argument length (avoid one-liners); counting
+    # terminator runs scans once without building a throwaway list of
+    # sentences with re.split
+    stripped = text.strip()
+    sentence_count = sum(1 for _ in _TERMINATOR_RUN_RE.finditer(stripped))
+    if stripped and not stripped.endswith(('.', '!', '?')):
+        sentence_count += 1  # trailing sentence without punctuation
+    if sentence_count < 2:
         issues.append("too brief for proper argumentation")
     
     return issues
 
 
-def _llm_fallacy_analysis(text: str) -> int:
-    """Use Groq LLM for advanced fallacy detection"""
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if not groq_api_key:
-        return 0
-    
-    groq_url = "https://api.groq.com/openai/v1/chat/completions"
-    
-    prompt = f"""
+# Cosine similarity above which two texts share one LLM verdict
+_SEMANTIC_THRESHOLD = 0.95
+_semantic_scores = []  # scores aligned with the rows of _semantic_emb
+_semantic_emb = None
+_embedder = None
+
+
+def _semantic_lookup(text: str):
+    """Return (cached score or None, normalized embedding or None)."""
+    global _embedder
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return None, None
+    if _embedder is None:
+        _embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    emb = _embedder.encode(text).astype(np.float32)
+    norm = np.linalg.norm(emb)
+    if norm:
+        emb /= norm
+    if _semantic_emb is not None:
+        similarities = _semantic_emb @ emb
+        best = int(np.argmax(similarities))
+        if similarities[best] > _SEMANTIC_THRESHOLD:
+            return _semantic_scores[best], emb
+    return None, emb
+
+
+def _semantic_store(emb, score: int):
+    """Record an embedding/score pair for future lookups."""
+    global _semantic_emb
+    if emb is None:
+        return
+    _semantic_scores.append(score)
+    _semantic_emb = (emb.reshape(1, -1) if _semantic_emb is None
+                     else np.vstack([_semantic_emb, emb]))
+
+
+# Client-side guardrails around the LLM tier: a token bucket keeps call
+# volume under the API rate limit, and a circuit breaker skips calls for
+# a cooldown window after repeated failures. Both short-circuit to the
+# neutral score 0 so pattern checks still decide the outcome.
+_BUCKET_CAPACITY = 30        # burst size, in calls
+_BUCKET_REFILL_RATE = 0.5    # sustained calls per second
+_BREAKER_THRESHOLD = 3       # consecutive failures before opening
+_BREAKER_COOLDOWN = 30.0     # seconds the breaker stays open
+
+_bucket_tokens = float(_BUCKET_CAPACITY)
+_bucket_stamp = time.monotonic()
+_failures = 0
+_open_until = 0.0
+
+
+def _llm_call_allowed() -> bool:
+    """True if the breaker is closed and a rate-limit token is available."""
+    global _bucket_tokens, _bucket_stamp
+    now = time.monotonic()
+    if now < _open_until:
+        return False
+    _bucket_tokens = min(float(_BUCKET_CAPACITY),
+                         _bucket_tokens + (now - _bucket_stamp) * _BUCKET_REFILL_RATE)
+    _bucket_stamp = now
+    if _bucket_tokens < 1:
+        return False
+    _bucket_tokens -= 1
+    return True
+
+
+def _record_llm_result(ok: bool):
+    """Track call outcomes; repeated failures open the breaker."""
+    global _failures, _open_until
+    if ok:
+        _failures = 0
+    else:
+        _failures += 1
+        if _failures >= _BREAKER_THRESHOLD:
+            _open_until = time.monotonic() + _BREAKER_COOLDOWN
+            _failures = 0
+
+
+# Shared async HTTP client, created lazily so importing the module does
+# not open connections
+_CLIENT = None
+
+
+def _get_async_client():
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(timeout=10)
+    return _CLIENT
+
+
+def _response_content(response) -> str:
+    """Pull choices[0].message.content from a Groq response body.
+
+    orjson parses the raw bytes with SIMD when available; response.json()
+    is the fallback.
+    """
+    result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    return result["choices"][0]["message"]["content"]
+
+
+def _analysis_prompt(text: str) -> str:
+    """Build the single-text fallacy analysis prompt."""
+    return f"""
     Analyze the following text for logical fallacies. Look for these common fallacies:
     1. Ad Hominem - attacking the person instead of the argument
     2. Straw Man - misrepresenting someone's argument
@@ -200,12 +370,32 @@ def _llm_fallacy_analysis(text: str) -> int:
     2 = Moderate fallacies
     3 = Severe fallacies
     """
-    
+
+
+@lru_cache(maxsize=10000)
+def _llm_fallacy_analysis(text: str) -> int:
+    """Use Groq LLM for advanced fallacy detection"""
+    if not _GROQ_API_KEY:
+        return 0
+
+    # Exact repeats are handled by the lru_cache; near-duplicates can
+    # still reuse a verdict through the optional semantic tier
+    cached_score, emb = _semantic_lookup(text)
+    if cached_score is not None:
+        return cached_score
+
+    if not _llm_call_allowed():
+        return 0
+
+    groq_url = "https://api.groq.com/openai/v1/chat/completions"
+
+    prompt = _analysis_prompt(text)
+
     try:
         response = requests.post(
             groq_url,
             headers={
-                "Authorization": f"Bearer {groq_api_key}",
+                "Authorization": f"Bearer {_GROQ_API_KEY}",
                 "Content-Type": "application/json"
             },
             json={
@@ -218,20 +408,138 @@ def _llm_fallacy_analysis(text: str) -> int:
         )
         
         if response.status_code == 200:
-            result = response.json()
-            llm_response = result["choices"][0]["message"]["content"].strip()
+            llm_response = _response_content(response).strip()
             # Extract number from response
             try:
-                return int(llm_response)
-            except:
-                return 0
+                score = int(llm_response)
+            except ValueError:
+                score = 0
+            _semantic_store(emb, score)
+            _record_llm_result(True)
+            return score
+        else:
+            _record_llm_result(False)
+            return 0
+
+    except Exception:
+        _record_llm_result(False)
+        return 0
+
+
+async def _llm_fallacy_analysis_async(text: str) -> int:
+    """Async variant of _llm_fallacy_analysis on the shared httpx client."""
+    if not _GROQ_API_KEY or not HTTPX_AVAILABLE:
+        return 0
+
+    cached_score, emb = _semantic_lookup(text)
+    if cached_score is not None:
+        return cached_score
+
+    if not _llm_call_allowed():
+        return 0
+
+    groq_url = "https://api.groq.com/openai/v1/chat/completions"
+
+    try:
+        response = await _get_async_client().post(
+            groq_url,
+            headers={
+                "Authorization": f"Bearer {_GROQ_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "mixtral-8x7b-32768",
+                "messages": [{"role": "user", "content": _analysis_prompt(text)}],
+                "temperature": 0.1,
+                "max_tokens": 10
+            }
+        )
+
+        if response.status_code == 200:
+            llm_response = _response_content(response).strip()
+            try:
+                score = int(llm_response)
+            except ValueError:
+                score = 0
+            _semantic_store(emb, score)
+            _record_llm_result(True)
+            return score
         else:
+            _record_llm_result(False)
             return 0
-            
+
     except Exception:
+        _record_llm_result(False)
         return 0
 
 
+def _llm_fallacy_analysis_batch(texts: List[str]) -> List[int]:
+    """Score several texts for fallacies with a single LLM round-trip.
+
+    The texts ride in one numbered prompt and the model answers with a
+    JSON array of scores, so the per-request latency and token overhead
+    are paid once per batch instead of once per text.
+    """
+    if not _GROQ_API_KEY or not texts:
+        return [0] * len(texts)
+
+    if not _llm_call_allowed():
+        return [0] * len(texts)
+
+    groq_url = "https://api.groq.com/openai/v1/chat/completions"
+
+    numbered = "\n".join(f'{i + 1}. "{text}"' for i, text in enumerate(texts))
+    prompt = f"""
+    Rate each of the following texts for logical fallacies (ad hominem,
+    straw man, false dilemma, appeal to authority, bandwagon, circular
+    reasoning, slippery slope, hasty generalization, appeal to emotion,
+    red herring).
+
+    Texts:
+    {numbered}
+
+    Respond with only a JSON array of {len(texts)} integers, one per text
+    in order, where each integer is 0-3:
+    0 = No fallacies detected
+    1 = Minor fallacies
+    2 = Moderate fallacies
+    3 = Severe fallacies
+    """
+
+    try:
+        response = requests.post(
+            groq_url,
+            headers={
+                "Authorization": f"Bearer {_GROQ_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "mixtral-8x7b-32768",
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.1,
+                "max_tokens": 5 * len(texts) + 10
+            },
+            timeout=10
+        )
+
+        if response.status_code == 200:
+            _record_llm_result(True)
+            llm_response = _response_content(response).strip()
+            try:
+                scores = json.loads(llm_response)
+            except ValueError:
+                return [0] * len(texts)
+            if isinstance(scores, list) and len(scores) == len(texts):
+                return [int(s) if isinstance(s, (int, float)) else 0 for s in scores]
+            return [0] * len(texts)
+        _record_llm_result(False)
+        return [0] * len(texts)
+
+    except Exception:
+        _record_llm_result(False)
+        return [0] * len(texts)
+
+
 class FallacyGuard:
     """Simple guardrail for logical fallacy detection"""
     
@@ -245,44 +553,76 @@ class FallacyGuard:
         if detector_type not in valid_types:
             raise ValueError(f"Unknown detector type: {detector_type}")
     
-    def validate(self, value: str) -> str:
+    def validate(self, value: str, features: Optional[TextFeatures] = None) -> str:
         """Validate the input text"""
         if self.detector_type == "fallacy":
-            return logical_fallacy_validator(value, use_llm=self.use_llm)
+            return logical_fallacy_validator(value, use_llm=self.use_llm, features=features)
         elif self.detector_type == "structure":
-            return logical_fallacy_validator(value, use_llm=self.use_llm, require_structure=True)
+            return logical_fallacy_validator(value, use_llm=self.use_llm, require_structure=True,
+                                             features=features)
         else:
             raise ValueError(f"Unknown detector type: {self.detector_type}")
 
+    async def validate_async(self, value: str) -> str:
+        """Async validation; concurrent LLM calls share one httpx client"""
+        llm_score = 0
+        if self.use_llm and _GROQ_API_KEY:
+            llm_score = await _llm_fallacy_analysis_async(value)
+        return logical_fallacy_validator(
+            value, use_llm=False,
+            require_structure=(self.detector_type == "structure"),
+            llm_score=llm_score
+        )
+
+    def validate_batch(self, values: List[str]) -> List[Dict[str, Any]]:
+        """Validate many texts, sharing one batched LLM call across them.
+
+        Pattern checks still run locally per text; the LLM tier (when
+        enabled) scores the whole batch in a single request.
+        """
+        if self.use_llm and _GROQ_API_KEY:
+            llm_scores = _llm_fallacy_analysis_batch(values)
+        else:
+            llm_scores = [0] * len(values)
+
+        results = []
+        for value, llm_score in zip(values, llm_scores):
+            try:
+                validated = logical_fallacy_validator(
+                    value, use_llm=False,
+                    require_structure=(self.detector_type == "structure"),
+                    llm_score=llm_score
+                )
+                results.append({"input": value, "status": "PASSED", "output": validated})
+            except Exception as e:
+                results.append({"input": value, "status": "BLOCKED", "reason": str(e)})
+        return results
+
 
 def create_fallacy_guard(detector_type: str = "fallacy", use_llm: bool = True, **kwargs) -> FallacyGuard:
     """Create a logical fallacy detection guardrail"""
     return FallacyGuard(detector_type, use_llm, **kwargs)
 
 
+# Inputs shared by the sync and async demos
+_DEMO_FALLACY_INPUTS = [
+    "Based on research, our approach shows significant improvement in efficiency metrics.",
+    "You're stupid if you don't agree with this obviously correct solution.",
+    "Either you support our proposal completely or you're against progress entirely.",
+    "All experts agree that this is the only viable solution to the problem.",
+    "Everyone is using this technology, so it must be the right choice.",
+    "This is true because it's always been true and that's how things work.",
+    "If we allow this change, eventually everything will collapse and chaos will ensue."
+]
+
+
 def demo_fallacy_detection():
     """Demo function to test logical fallacy detection"""
-    
+
     # Test fallacy detection
     guard_fallacy = create_fallacy_guard("fallacy", use_llm=True)
-    
-    test_inputs = [
-        "Based on research, our approach shows significant improvement in efficiency metrics.",
-        "You're stupid if you don't agree with this obviously correct solution.",
-        "Either you support our proposal completely or you're against progress entirely.",
-        "All experts agree that this is the only viable solution to the problem.",
-        "Everyone is using this technology, so it must be the right choice.",
-        "This is true because it's always been true and that's how things work.",
-        "If we allow this change, eventually everything will collapse and chaos will ensue."
-    ]
-    
-    results_fallacy = []
-    for text in test_inputs:
-        try:
-            validated = guard_fallacy.validate(text)
-            results_fallacy.append({"input": text, "status": "PASSED", "output": validated})
-        except Exception as e:
-            results_fallacy.append({"input": text, "status": "BLOCKED", "reason": str(e)})
+
+    results_fallacy = guard_fallacy.validate_batch(_DEMO_FALLACY_INPUTS)
     
     # Test argument structure validation
     guard_structure = create_fallacy_guard("structure", use_llm=False)
@@ -295,15 +635,23 @@ def demo_fallacy_detection():
         "According to research data, performance improves by 30%. Therefore, this method is recommended."
     ]
     
-    results_structure = []
-    for text in test_arguments:
-        try:
-            validated = guard_structure.validate(text)
-            results_structure.append({"input": text, "status": "PASSED", "output": validated})
-        except Exception as e:
-            results_structure.append({"input": text, "status": "BLOCKED", "reason": str(e)})
+    results_structure = guard_structure.validate_batch(test_arguments)
     
     return {
         "fallacy_detection": results_fallacy,
         "argument_structure": results_structure
-    }
\ No newline at end of file
+    }
+
+
+async def demo_fallacy_detection_async():
+    """Async demo: all fallacy inputs are validated concurrently"""
+    guard = create_fallacy_guard("fallacy", use_llm=True)
+
+    async def check(text: str) -> Dict[str, Any]:
+        try:
+            validated = await guard.validate_async(text)
+            return {"input": text, "status": "PASSED", "output": validated}
+        except Exception as e:
+            return {"input": text, "status": "BLOCKED", "reason": str(e)}
+
+    return list(await asyncio.gather(*(check(text) for text in _DEMO_FALLACY_INPUTS)))
\ No newline at end of file
@@ -1,84 +1,120 @@
+import asyncio
+import json
 import os
 import re
-from typing import List, Dict, Any
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 import requests
 from guardrails.errors import ValidationError
 
-load_dotenv()
+# Optional async HTTP client for concurrent LLM calls
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
+# Optional SIMD JSON parser for decoding Groq responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def psychological_manipulation_validator(value: str, use_llm: bool = True) -> str:
+# Optional semantic cache so near-duplicate texts reuse LLM verdicts
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+from guardrails_showcase.advanced._shared import PatternScanner, TextFeatures, analyze
+
+# Only pay for .env parsing when the key is not already exported, and
+# resolve it once at import instead of per LLM call
+if not os.getenv("GROQ_API_KEY"):
+    load_dotenv()
+_GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+
+# Pattern-based detection for common manipulation tactics
+_MANIPULATION_PATTERNS = {
+    "urgency": [
+        r"\b(urgent|immediately|now|hurry|limited time|expires soon|act fast)\b",
+        r"\b(don't wait|last chance|only \d+ left|while supplies last)\b"
+    ],
+    "fear_appeal": [
+        r"\b(dangerous|risky|unsafe|threat|warning|alert|beware)\b",
+        r"\b(you'll regret|miss out|lose forever|never again)\b"
+    ],
+    "social_proof": [
+        r"\b(everyone is|most people|thousands of|millions of)\b",
+        r"\b(join the crowd|be like others|don't be left behind)\b"
+    ],
+    "authority": [
+        r"\b(experts say|doctors recommend|studies show|proven by)\b",
+        r"\b(as seen on|endorsed by|approved by|certified)\b"
+    ],
+    "scarcity": [
+        r"\b(limited|exclusive|rare|only \d+|few remaining)\b",
+        r"\b(sold out soon|running out|almost gone)\b"
+    ]
+}
+
+
+# One engine scans all manipulation categories in a single pass
+_MANIPULATION_SCANNER = PatternScanner(_MANIPULATION_PATTERNS)
+
+
+def psychological_manipulation_validator(value: str, use_llm: bool = True,
+                                         llm_score: int = 0,
+                                         features: Optional[TextFeatures] = None) -> str:
     """Validator function that detects psychological manipulation techniques"""
-    
-    # Pattern-based detection for common manipulation tactics
-    manipulation_patterns = {
-        "urgency": [
-            r"\b(urgent|immediately|now|hurry|limited time|expires soon|act fast)\b",
-            r"\b(don't wait|last chance|only \d+ left|while supplies last)\b"
-        ],
-        "fear_appeal": [
-            r"\b(dangerous|risky|unsafe|threat|warning|alert|beware)\b",
-            r"\b(you'll regret|miss out|lose forever|never again)\b"
-        ],
-        "social_proof": [
-            r"\b(everyone is|most people|thousands of|millions of)\b",
-            r"\b(join the crowd|be like others|don't be left behind)\b"
-        ],
-        "authority": [
-            r"\b(experts say|doctors recommend|studies show|proven by)\b",
-            r"\b(as seen on|endorsed by|approved by|certified)\b"
-        ],
-        "scarcity": [
-            r"\b(limited|exclusive|rare|only \d+|few remaining)\b",
-            r"\b(sold out soon|running out|almost gone)\b"
-        ]
-    }
-    
-    # Detect manipulation patterns using regex
-    detected = {}
-    text_lower = value.lower()
-    
-    for category, patterns in manipulation_patterns.items():
-        matches = []
-        for pattern in patterns:
-            found = re.findall(pattern, text_lower, re.IGNORECASE)
-            matches.extend(found)
-        if matches:
-            detected[category] = matches
-    
-    # Calculate manipulation score
+
+    # Shared features (lowering and word tallies) may arrive precomputed
+    # from a pipeline that chains several guards over the same text
+    if features is None:
+        features = analyze(value, _MANIPULATION_SCANNER)
+    text_lower = features.text_lower
+
+    # Detect manipulation patterns in one streamed scan, stopping as soon
+    # as the blocking threshold is already guaranteed
+    if features.hits is not None:
+        matches_iter = ((cat, m) for cat, ms in features.hits.items() for m in ms)
+    else:
+        matches_iter = _MANIPULATION_SCANNER.iter_matches(text_lower)
+
     manipulation_score = 0
     detected_techniques = []
-    
-    # Score based on pattern matches
-    for category, matches in detected.items():
-        manipulation_score += len(matches) * 1
-        detected_techniques.extend([f"{category}: {match}" for match in matches])
+    for category, match in matches_iter:
+        manipulation_score += 1
+        detected_techniques.append(f"{category}: {match}")
+        if manipulation_score >= 3 or len(detected_techniques) >= 2:
+            break
     
     # Additional checks for specific indicators
     # Check for excessive emotional language
-    emotional_words = ['outrageous', 'ridiculous', 'absurd', 'insane', 'crazy', 'stupid']
-    emotional_count = sum(1 for word in emotional_words if word in text_lower)
-    if emotional_count >= 2:
+    if features.emotional_count >= 2:
         manipulation_score += 1
         detected_techniques.append("appeal to emotion: excessive emotional language")
-    
+
     # Check for absolute statements
-    absolute_words = ['always', 'never', 'all', 'none', 'every', 'completely', 'totally']
-    absolute_count = sum(1 for word in absolute_words if f' {word} ' in f' {text_lower} ')
-    if absolute_count >= 2:
+    if features.absolute_count >= 2:
         manipulation_score += 1
         detected_techniques.append("hasty generalization: absolute statements")
     
-    # LLM-based analysis (optional, if Groq API key is available)
-    if use_llm and os.getenv("GROQ_API_KEY"):
+    # LLM-based analysis (optional, if Groq API key is available); batch
+    # callers pass a pre-computed llm_score instead
+    manipulation_score += llm_score
+    if use_llm and _GROQ_API_KEY:
         try:
-            llm_score = _llm_manipulation_analysis(value)
-            manipulation_score += llm_score
+            manipulation_score += _llm_manipulation_analysis(value)
         except Exception:
             pass  # Continue without LLM if there's an error
-    
+
     # If high manipulation score or specific patterns detected, block
     if manipulation_score >= 3 or len(detected_techniques) >= 2:
         raise ValidationError(
@@ -89,15 +125,109 @@ def psychological_manipulation_validator(value: str, use_llm: bool = True) -> st
     return value
 
 
-def _llm_manipulation_analysis(text: str) -> int:
-    """Use Groq LLM for advanced manipulation detection"""
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if not groq_api_key:
-        return 0
-    
-    groq_url = "https://api.groq.com/openai/v1/chat/completions"
-    
-    prompt = f"""
+# Cosine similarity above which two texts share one LLM verdict
+_SEMANTIC_THRESHOLD = 0.95
+_semantic_scores = []  # scores aligned with the rows of _semantic_emb
+_semantic_emb = None
+_embedder = None
+
+
+def _semantic_lookup(text: str):
+    """Return (cached score or None, normalized embedding or None)."""
+    global _embedder
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return None, None
+    if _embedder is None:
+        _embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    emb = _embedder.encode(text).astype(np.float32)
+    norm = np.linalg.norm(emb)
+    if norm:
+        emb /= norm
+    if _semantic_emb is not None:
+        similarities = _semantic_emb @ emb
+        best = int(np.argmax(similarities))
+        if similarities[best] > _SEMANTIC_THRESHOLD:
+            return _semantic_scores[best], emb
+    return None, emb
+
+
+def _semantic_store(emb, score: int):
+    """Record an embedding/score pair for future lookups."""
+    global _semantic_emb
+    if emb is None:
+        return
+    _semantic_scores.append(score)
+    _semantic_emb = (emb.reshape(1, -1) if _semantic_emb is None
+                     else np.vstack([_semantic_emb, emb]))
+
+
+# Client-side guardrails around the LLM tier: a token bucket keeps call
+# volume under the API rate limit, and a circuit breaker skips calls for
+# a cooldown window after repeated failures. Both short-circuit to the
+# neutral score 0 so pattern checks still decide the outcome.
+_BUCKET_CAPACITY = 30        # burst size, in calls
+_BUCKET_REFILL_RATE = 0.5    # sustained calls per second
+_BREAKER_THRESHOLD = 3       # consecutive failures before opening
+_BREAKER_COOLDOWN = 30.0     # seconds the breaker stays open
+
+_bucket_tokens = float(_BUCKET_CAPACITY)
+_bucket_stamp = time.monotonic()
+_failures = 0
+_open_until = 0.0
+
+
+def _llm_call_allowed() -> bool:
+    """True if the breaker is closed and a rate-limit token is available."""
+    global _bucket_tokens, _bucket_stamp
+    now = time.monotonic()
+    if now < _open_until:
+        return False
+    _bucket_tokens = min(float(_BUCKET_CAPACITY),
+                         _bucket_tokens + (now - _bucket_stamp) * _BUCKET_REFILL_RATE)
+    _bucket_stamp = now
+    if _bucket_tokens < 1:
+        return False
+    _bucket_tokens -= 1
+    return True
+
+
+def _record_llm_result(ok: bool):
+    """Track call outcomes; repeated failures open the breaker."""
+    global _failures, _open_until
+    if ok:
+        _failures = 0
+    else:
+        _failures += 1
+        if _failures >= _BREAKER_THRESHOLD:
+            _open_until = time.monotonic() + _BREAKER_COOLDOWN
+            _failures = 0
+
+
+# Shared async HTTP client, created lazily so importing the module does
+# not open connections
+_CLIENT = None
+
+
+def _get_async_client():
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(timeout=10)
+    return _CLIENT
+
+
+def _response_content(response) -> str:
+    """Pull choices[0].message.content from a Groq response body.
+
+    orjson parses the raw bytes with SIMD when available; response.json()
+    is the fallback.
+    """
+    result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    return result["choices"][0]["message"]["content"]
+
+
+def _analysis_prompt(text: str) -> str:
+    """Build the single-text manipulation analysis prompt."""
+    return f"""
     Analyze the following text for psychological manipulation techniques. 
     Look for:
     1. Emotional manipulation (fear, guilt, shame)
@@ -110,15 +240,35 @@ def _llm_manipulation_analysis(text: str) -> int:
     Respond with only a number from 0-3 representing manipulation level:
     0 = No manipulation detected
     1 = Mild manipulation
-    2 = Moderate manipulation  
+    2 = Moderate manipulation
     3 = High manipulation
     """
-    
+
+
+@lru_cache(maxsize=10000)
+def _llm_manipulation_analysis(text: str) -> int:
+    """Use Groq LLM for advanced manipulation detection"""
+    if not _GROQ_API_KEY:
+        return 0
+
+    # Exact repeats are handled by the lru_cache; near-duplicates can
+    # still reuse a verdict through the optional semantic tier
+    cached_score, emb = _semantic_lookup(text)
+    if cached_score is not None:
+        return cached_score
+
+    if not _llm_call_allowed():
+        return 0
+
+    groq_url = "https://api.groq.com/openai/v1/chat/completions"
+
+    prompt = _analysis_prompt(text)
+
     try:
         response = requests.post(
             groq_url,
             headers={
-                "Authorization": f"Bearer {groq_api_key}",
+                "Authorization": f"Bearer {_GROQ_API_KEY}",
                 "Content-Type": "application/json"
             },
             json={
@@ -131,29 +281,177 @@ def _llm_manipulation_analysis(text: str) -> int:
         )
         
         if response.status_code == 200:
-            result = response.json()
-            llm_response = result["choices"][0]["message"]["content"].strip()
+            llm_response = _response_content(response).strip()
             # Extract number from response
             try:
-                return int(llm_response)
-            except:
-                return 0
+                score = int(llm_response)
+            except ValueError:
+                score = 0
+            _semantic_store(emb, score)
+            _record_llm_result(True)
+            return score
+        else:
+            _record_llm_result(False)
+            return 0
+
+    except Exception:
+        _record_llm_result(False)
+        return 0
+
+
+async def _llm_manipulation_analysis_async(text: str) -> int:
+    """Async variant of _llm_manipulation_analysis on the shared httpx client."""
+    if not _GROQ_API_KEY or not HTTPX_AVAILABLE:
+        return 0
+
+    cached_score, emb = _semantic_lookup(text)
+    if cached_score is not None:
+        return cached_score
+
+    if not _llm_call_allowed():
+        return 0
+
+    groq_url = "https://api.groq.com/openai/v1/chat/completions"
+
+    try:
+        response = await _get_async_client().post(
+            groq_url,
+            headers={
+                "Authorization": f"Bearer {_GROQ_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "mixtral-8x7b-32768",
+                "messages": [{"role": "user", "content": _analysis_prompt(text)}],
+                "temperature": 0.1,
+                "max_tokens": 10
+            }
+        )
+
+        if response.status_code == 200:
+            llm_response = _response_content(response).strip()
+            try:
+                score = int(llm_response)
+            except ValueError:
+                score = 0
+            _semantic_store(emb, score)
+            _record_llm_result(True)
+            return score
         else:
+            _record_llm_result(False)
             return 0
-            
+
     except Exception:
+        _record_llm_result(False)
         return 0
 
 
+def _llm_manipulation_analysis_batch(texts: List[str]) -> List[int]:
+    """Score several texts for manipulation with a single LLM round-trip.
+
+    The texts ride in one numbered prompt and the model answers with a
+    JSON array of scores, so the per-request latency and token overhead
+    are paid once per batch instead of once per text.
+    """
+    if not _GROQ_API_KEY or not texts:
+        return [0] * len(texts)
+
+    if not _llm_call_allowed():
+        return [0] * len(texts)
+
+    groq_url = "https://api.groq.com/openai/v1/chat/completions"
+
+    numbered = "\n".join(f'{i + 1}. "{text}"' for i, text in enumerate(texts))
+    prompt = f"""
+    Rate each of the following texts for psychological manipulation
+    techniques (emotional manipulation, cognitive bias exploitation,
+    persuasion techniques, deceptive practices).
+
+    Texts:
+    {numbered}
+
+    Respond with only a JSON array of {len(texts)} integers, one per text
+    in order, where each integer is 0-3:
+    0 = No manipulation detected
+    1 = Mild manipulation
+    2 = Moderate manipulation
+    3 = High manipulation
+    """
+
+    try:
+        response = requests.post(
+            groq_url,
+            headers={
+                "Authorization": f"Bearer {_GROQ_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "mixtral-8x7b-32768",
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.1,
+                "max_tokens": 5 * len(texts) + 10
+            },
+            timeout=10
+        )
+
+        if response.status_code == 200:
+            _record_llm_result(True)
+            llm_response = _response_content(response).strip()
+            try:
+                scores = json.loads(llm_response)
+            except ValueError:
+                return [0] * len(texts)
+            if isinstance(scores, list) and len(scores) == len(texts):
+                return [int(s) if isinstance(s, (int, float)) else 0 for s in scores]
+            return [0] * len(texts)
+        _record_llm_result(False)
+        return [0] * len(texts)
+
+    except Exception:
+        _record_llm_result(False)
+        return [0] * len(texts)
+
+
 class ManipulationGuard:
     """Simple guardrail for psychological manipulation detection"""
     
     def __init__(self, use_llm: bool = True):
         self.use_llm = use_llm
     
-    def validate(self, value: str) -> str:
+    def validate(self, value: str, features: Optional[TextFeatures] = None) -> str:
         """Validate the input text"""
-        return psychological_manipulation_validator(value, self.use_llm)
+        return psychological_manipulation_validator(value, self.use_llm, features=features)
+
+    async def validate_async(self, value: str) -> str:
+        """Async validation; concurrent LLM calls share one httpx client"""
+        llm_score = 0
+        if self.use_llm and _GROQ_API_KEY:
+            llm_score = await _llm_manipulation_analysis_async(value)
+        return psychological_manipulation_validator(
+            value, use_llm=False, llm_score=llm_score
+        )
+
+    def validate_batch(self, values: List[str]) -> List[Dict[str, Any]]:
+        """Validate many texts, sharing one batched LLM call across them.
+
+        Pattern checks still run locally per text; the LLM tier (when
+        enabled) scores the whole batch in a single request.
+        """
+        if self.use_llm and _GROQ_API_KEY:
+            llm_scores = _llm_manipulation_analysis_batch(values)
+        else:
+            llm_scores = [0] * len(values)
+
+        results = []
+        for value, llm_score in zip(values, llm_scores):
+            try:
+                validated = psychological_manipulation_validator(
+                    value, use_llm=False, llm_score=llm_score
+                )
+                results.append({"input": value, "status": "PASSED", "output": validated})
+            except Exception as e:
+                results.append({"input": value, "status": "BLOCKED", "reason": str(e)})
+        return results
 
 
 def create_manipulation_guard(use_llm: bool = True) -> ManipulationGuard:
@@ -161,24 +459,32 @@ def create_manipulation_guard(use_llm: bool = True) -> ManipulationGuard:
     return ManipulationGuard(use_llm)
 
 
+# Inputs shared by the sync and async demos
+_DEMO_MANIPULATION_INPUTS = [
+    "Our product is great and can help improve your productivity.",
+    "ACT NOW! Limited time offer - only 3 left! Don't miss out or you'll regret it forever!",
+    "Experts say this is dangerous - you need our protection immediately!",
+    "Everyone is buying this - don't be left behind! Join thousands of satisfied customers.",
+    "This exclusive offer expires in 1 hour. Most people who wait lose this opportunity forever."
+]
+
+
 def demo_manipulation_detection():
     """Demo function to test manipulation detection"""
     guard = create_manipulation_guard(use_llm=True)
-    
-    test_inputs = [
-        "Our product is great and can help improve your productivity.",
-        "ACT NOW! Limited time offer - only 3 left! Don't miss out or you'll regret it forever!",
-        "Experts say this is dangerous - you need our protection immediately!",
-        "Everyone is buying this - don't be left behind! Join thousands of satisfied customers.",
-        "This exclusive offer expires in 1 hour. Most people who wait lose this opportunity forever."
-    ]
-    
-    results = []
-    for text in test_inputs:
+
+    return guard.validate_batch(_DEMO_MANIPULATION_INPUTS)
+
+
+async def demo_manipulation_detection_async():
+    """Async demo: all manipulation inputs are validated concurrently"""
+    guard = create_manipulation_guard(use_llm=True)
+
+    async def check(text: str) -> Dict[str, Any]:
         try:
-            validated = guard.validate(text)
-            results.append({"input": text, "status": "PASSED", "output": validated})
+            validated = await guard.validate_async(text)
+            return {"input": text, "status": "PASSED", "output": validated}
         except Exception as e:
-            results.append({"input": text, "status": "BLOCKED", "reason": str(e)})
-    
-    return results
\ No newline at end of file
+            return {"input": text, "status": "BLOCKED", "reason": str(e)}
+
+    return list(await asyncio.gather(*(check(text) for text in _DEMO_MANIPULATION_INPUTS)))
\ No newline at end of file
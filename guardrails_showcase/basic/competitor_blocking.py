@@ -1,7 +1,26 @@
-import re
 from typing import List, Dict, Any
 from guardrails.errors import ValidationError
 
+# Optional Aho-Corasick automaton for single-pass multi-competitor scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+_WORD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+)
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not embedded inside a longer word."""
+    if start > 0 and text[start - 1] in _WORD_CHARS:
+        return False
+    if end < len(text) and text[end] in _WORD_CHARS:
+        return False
+    return True
+
 
 def competitor_mention_validator(value: str, competitors: List[str], case_sensitive: bool = False) -> str:
     """Validator function that blocks competitor mentions"""
@@ -13,12 +32,16 @@ def competitor_mention_validator(value: str, competitors: List[str], case_sensit
         competitors_lower = competitors
         
     for competitor in competitors_lower:
-        pattern = r'\b' + re.escape(competitor) + r'\b'
-        if re.search(pattern, value_lower):
-            raise ValidationError(
-                f"Content mentions competitor: {competitor}. "
-                "Please revise to focus on our own solutions."
-            )
+        # str.find uses an optimized substring search (memmem-style), so a
+        # plain scan plus boundary checks beats compiling a regex per name
+        pos = value_lower.find(competitor)
+        while pos != -1:
+            if _is_whole_word(value_lower, pos, pos + len(competitor)):
+                raise ValidationError(
+                    f"Content mentions competitor: {competitor}. "
+                    "Please revise to focus on our own solutions."
+                )
+            pos = value_lower.find(competitor, pos + 1)
     return value
 
 
@@ -28,9 +51,33 @@ class CompetitorGuard:
     def __init__(self, competitors: List[str], case_sensitive: bool = False):
         self.competitors = competitors
         self.case_sensitive = case_sensitive
-    
+
+        # Build the automaton once so every validate() call scans the text
+        # in a single pass regardless of how many competitors are listed
+        normalized = competitors if case_sensitive else [c.lower() for c in competitors]
+        if AHOCORASICK_AVAILABLE and normalized:
+            automaton = ahocorasick.Automaton()
+            for name in normalized:
+                automaton.add_word(name, name)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._automaton = None
+
     def validate(self, value: str) -> str:
         """Validate the input text"""
+        if self._automaton is not None:
+            haystack = value if self.case_sensitive else value.lower()
+            # The automaton matches substrings; the boundary check keeps
+            # the whole-word semantics of the regex path
+            for end_pos, name in self._automaton.iter(haystack):
+                start = end_pos - len(name) + 1
+                if _is_whole_word(haystack, start, end_pos + 1):
+                    raise ValidationError(
+                        f"Content mentions competitor: {name}. "
+                        "Please revise to focus on our own solutions."
+                    )
+            return value
         return competitor_mention_validator(value, self.competitors, self.case_sensitive)
 
 
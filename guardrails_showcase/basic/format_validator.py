@@ -3,9 +3,10 @@ from typing import Dict, Any, Optional
 from guardrails.errors import ValidationError
 
 
-def exact_format_validator(value: str, word_count: Optional[int] = None, 
+def exact_format_validator(value: str, word_count: Optional[int] = None,
                           all_caps: bool = False, pattern: Optional[str] = None,
-                          allowed_chars: Optional[str] = None) -> str:
+                          allowed_chars: Optional[str] = None,
+                          disallow_re: Optional[Any] = None) -> str:
     """Validator function for exact format requirements"""
     value = value.strip()
     errors = []
@@ -21,14 +22,21 @@ def exact_format_validator(value: str, word_count: Optional[int] = None,
         if not value.isupper():
             errors.append("All text must be in uppercase")
     
-    # Check custom pattern
+    # Check custom pattern (accepts a string or a precompiled regex)
     if pattern:
-        if not re.match(pattern, value):
-            errors.append(f"Text must match pattern: {pattern}")
-    
-    # Check allowed characters
-    if allowed_chars:
-        invalid_chars = set(value) - set(allowed_chars)
+        pattern_re = pattern if hasattr(pattern, 'match') else re.compile(pattern)
+        if not pattern_re.match(value):
+            errors.append(f"Text must match pattern: {pattern_re.pattern}")
+
+    # Check allowed characters; a precompiled negated character class
+    # finds every offender in one C-level scan
+    if disallow_re is not None:
+        invalid_chars = set(disallow_re.findall(value))
+        if invalid_chars:
+            errors.append(f"Contains invalid characters: {', '.join(invalid_chars)}")
+    elif allowed_chars:
+        allowed = allowed_chars if isinstance(allowed_chars, frozenset) else frozenset(allowed_chars)
+        invalid_chars = set(value) - allowed
         if invalid_chars:
             errors.append(f"Contains invalid characters: {', '.join(invalid_chars)}")
     
@@ -76,15 +84,21 @@ class FormatGuard:
             self.allowed_chars = kwargs.get('allowed_chars')
         else:
             raise ValueError(f"Unknown validator type: {validator_type}")
-    
+
+        # Compile the pattern and freeze the character set once here, so
+        # validate() pays no per-call regex or set construction cost
+        self._pattern_re = re.compile(self.pattern) if self.pattern else None
+        self._disallow_re = (re.compile(f"[^{re.escape(self.allowed_chars)}]")
+                             if self.allowed_chars else None)
+
     def validate(self, value: str) -> str:
         """Validate the input text"""
         return exact_format_validator(
-            value, 
+            value,
             word_count=self.word_count,
             all_caps=self.all_caps,
-            pattern=self.pattern,
-            allowed_chars=self.allowed_chars
+            pattern=self._pattern_re,
+            disallow_re=self._disallow_re
         )
 
 
@@ -14,90 +14,296 @@ DIFFICULTY: ⭐☆☆ (Beginner)
 """
 
 import re
-from typing import List, Set
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 from guardrails.errors import ValidationError
 
+# Optional Aho-Corasick automaton: one linear pass over the text no
+# matter how many items the ban list holds
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional Hyperscan engine: SIMD multi-pattern scan, worthwhile once a
+# ban list grows past a few dozen terms
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+@lru_cache(maxsize=1024)
+def _lower(s: str) -> str:
+    """Cache lowered copies; identical inputs recur in validation loops."""
+    return s.lower()
+
+
+# Single pass that splits text into word tokens; whole-word checks then
+# become O(1) set membership per banned term
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
+
+# 256-byte table mapping A-Z to a-z: lowering bytes through translate()
+# is one table lookup per byte, no Unicode case folding involved
+_ASCII_LOWER = bytes.maketrans(
+    bytes(range(ord('A'), ord('Z') + 1)),
+    bytes(range(ord('a'), ord('z') + 1)),
+)
+
+
+@lru_cache(maxsize=64)
+def _compile_banlist(terms: tuple, case_sensitive: bool, partial: bool) -> tuple:
+    """Compile one ban list's matchers, shared across identical guards.
+
+    Keyed on the sorted normalized terms plus the matching flags, so
+    several guards built from the same list reuse one Hyperscan
+    database / automaton / fused pattern instead of recompiling.
+    Returns (hs_db, hs_terms, automaton, word_pattern).
+    """
+    # Large lists compile into a Hyperscan database: one vectorized
+    # scan across every term. The automaton below stays the fallback.
+    hs_db = None
+    hs_terms = ()
+    if HYPERSCAN_AVAILABLE and partial and len(terms) > 64:
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[re.escape(term).encode() for term in terms],
+                ids=list(range(len(terms))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(terms),
+            )
+            hs_db = db
+            hs_terms = terms
+        except hyperscan.error:
+            hs_db = None  # Unsupported term; use the automaton
+
+    # Compile the list into an automaton once so each validate() call
+    # scans the text a single time instead of once per banned item
+    automaton = None
+    if hs_db is None and AHOCORASICK_AVAILABLE and partial and terms:
+        automaton = ahocorasick.Automaton()
+        for item in terms:
+            automaton.add_word(item, item)
+        automaton.make_automaton()
+
+    # Whole-word mode: fuse the list into one boundary-fenced
+    # alternation so each validation runs a single search instead of
+    # one regex per term. Longer terms come first so they win over
+    # shorter prefixes in the alternation.
+    word_pattern = None
+    if not partial and terms:
+        ordered = sorted(terms, key=len, reverse=True)
+        word_pattern = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, ordered)) + r')\b',
+            0 if case_sensitive else re.IGNORECASE
+        )
+
+    return hs_db, hs_terms, automaton, word_pattern
+
 
 class BanListGuard:
     """
     A guardrail that blocks content containing banned words or phrases.
-    
-    TODO: Students will implement the core validation logic.
     """
-    
-    def __init__(self, banned_items: List[str], case_sensitive: bool = False, 
-                 partial_match: bool = True):
+
+    def __init__(self, banned_items: List[str], case_sensitive: bool = False,
+                 partial_match: bool = True,
+                 frequencies: Optional[Dict[str, float]] = None):
         """
         Initialize the ban list guardrail.
-        
+
         Args:
             banned_items: List of words/phrases to ban
             case_sensitive: Whether matching should be case sensitive
             partial_match: Whether to match partial words (e.g., "spam" in "spammer")
+            frequencies: Optional expected hit rate per item; common hits
+                are scanned first so the first-match short circuit fires
+                sooner
         """
-        self.banned_items = banned_items
+        # Immutable config keeps cached results valid for the lifetime of
+        # the guard
+        self.banned_items = tuple(banned_items)
         self.case_sensitive = case_sensitive
         self.partial_match = partial_match
-        
-        # TODO: STUDENT TASK 1
-        # Convert banned_items to appropriate format based on case_sensitive setting
-        # HINT: Consider using set() for faster lookups
-        # YOUR CODE HERE:
+
+        # Normalize the ban list once; interned strings in a frozenset
+        # compare by pointer on the lookup fast path, and mutating the
+        # original banned_items list after construction has no effect
         if case_sensitive:
-            self.banned_set = set(banned_items)
+            self.banned_set = frozenset(sys.intern(item) for item in banned_items)
         else:
-            # TODO: Convert all items to lowercase for case-insensitive matching
-            pass
-    
+            self.banned_set = frozenset(sys.intern(item.lower()) for item in banned_items)
+
+        # Frequency hints put likely hits at the front of the scan order;
+        # without them the set's own iteration order is used
+        if frequencies:
+            freq = (frequencies if case_sensitive
+                    else {key.lower(): rate for key, rate in frequencies.items()})
+            self._scan_order = tuple(
+                sorted(self.banned_set, key=lambda item: -freq.get(item, 0.0)))
+        else:
+            self._scan_order = tuple(self.banned_set)
+
+        # Verdicts (including blocks) memoized per input string, so tool
+        # loops and retries that re-validate the same text pay O(1)
+        self._result_cache = {}
+
+        # Matchers come from the module-level cache, so guards built
+        # from the same list share one compiled artifact set
+        self._hs_db, self._hs_terms, self._automaton, self._word_pattern = _compile_banlist(
+            tuple(sorted(self.banned_set)), case_sensitive, partial_match
+        )
+
+        # When the fallback substring scan will run and every term is
+        # ASCII, keep byte needles so the scan works on bytes: lowering
+        # becomes a translate-table pass and bytes.find does the rest
+        self._needles_b = None
+        if (self._hs_db is None and self._automaton is None and self.partial_match
+                and not case_sensitive and self.banned_set
+                and all(ord(ch) < 128 for item in self.banned_set for ch in item)):
+            self._needles_b = tuple(item.encode('ascii') for item in self._scan_order)
+
+        # Small fixed lists get a generated straight-line predicate: an
+        # or-chain of literal 'term' in t checks with no loop machinery,
+        # used as a fast no-hit short circuit before the reporting scan
+        self._fast = None
+        if self.partial_match and self._hs_db is None and self._automaton is None:
+            needles = self._needles_b if self._needles_b is not None else self._scan_order
+            if 0 < len(needles) <= 8:
+                checks = " or ".join(f"{needle!r} in t" for needle in needles)
+                namespace = {}
+                exec(f"def _fast(t):\n    return {checks}", {}, namespace)
+                self._fast = namespace["_fast"]
+
+        # When every banned term is itself a single word token, the
+        # whole-word check can tokenize the text once and test set
+        # membership; multi-word phrases keep the regex alternation
+        self._tokens_only = bool(
+            not partial_match and self.banned_set
+            and all(_TOKEN_RE.fullmatch(item) for item in self.banned_set)
+        )
+
+        # A frequency-ordered alternation is instance-specific, so it
+        # bypasses the shared cache. The trailing \b keeps prefix terms
+        # from winning over longer ones regardless of order.
+        if frequencies and not self.partial_match and self.banned_set:
+            self._word_pattern = re.compile(
+                r'\b(?:' + '|'.join(map(re.escape, self._scan_order)) + r')\b',
+                0 if case_sensitive else re.IGNORECASE
+            )
+
     def validate(self, value: str) -> str:
         """
         Validate input text against the ban list.
-        
+
         Args:
             value: Input text to validate
-            
+
         Returns:
             str: Original value if valid
-            
+
         Raises:
             ValidationError: If banned content is detected
         """
         if not value or not isinstance(value, str):
             return value
-            
-        # TODO: STUDENT TASK 2
-        # Implement the main validation logic
-        # YOUR CODE HERE:
-        
-        # Check if banned_set exists (student hasn't completed TODO yet)
-        if not hasattr(self, 'banned_set'):
-            return value  # Return unchanged if not implemented
-        
-        text_to_check = value if self.case_sensitive else value.lower()
-        
-        for banned_item in self.banned_set:
-            if self.partial_match:
-                # TODO: Check if banned_item appears anywhere in text_to_check
-                # HINT: Use 'in' operator or regex
-                pass
-            else:
-                # TODO: Check for exact word matches only
-                # HINT: Use word boundaries with regex or split by spaces
-                pass
-        
-        # If no banned content found, return original value
+
+        cached = self._result_cache.get(value)
+        if cached is None:
+            cached = self._validate_impl(value)
+            if len(self._result_cache) >= self._CACHE_MAX:
+                self._result_cache.pop(next(iter(self._result_cache)))
+            self._result_cache[value] = cached
+
+        ok, message = cached
+        if not ok:
+            raise ValidationError(message)
         return value
-    
-    def _is_whole_word_match(self, text: str, banned_word: str) -> bool:
-        """
-        Helper method to check for whole word matches.
-        
-        TODO: STUDENT TASK 3
-        # Implement whole word matching using regex word boundaries
-        # HINT: Use r'\b' for word boundaries
-        # YOUR CODE HERE:
-        """
-        pass
+
+    _CACHE_MAX = 2048
+
+    def _validate_impl(self, value: str) -> tuple:
+        """Do the actual scanning; returns a cacheable (ok, message) pair."""
+        if self.partial_match:
+            if self._needles_b is not None:
+                # ASCII-only list: lower via the byte table (errors=
+                # 'replace' keeps non-ASCII chars as separators) and let
+                # bytes.find scan for each needle
+                haystack = value.encode('ascii', 'replace').translate(_ASCII_LOWER)
+                if self._fast is not None and not self._fast(haystack):
+                    return True, None
+                hit_needle = next(filter(haystack.__contains__, self._needles_b), None)
+                if hit_needle is not None:
+                    return False, (
+                        f"Content contains banned item: '{hit_needle.decode('ascii')}'. "
+                        "Please remove it and try again."
+                    )
+                return True, None
+
+            # Remaining paths scan str; the whole-word pattern below
+            # folds case itself via IGNORECASE
+            text_to_check = value if self.case_sensitive else _lower(value)
+            if self._hs_db is not None:
+                found = []
+                # The handler returns 1 to stop at the first hit, which
+                # python-hyperscan reports by raising ScanTerminated; the
+                # matched id is already recorded by then
+                try:
+                    self._hs_db.scan(
+                        text_to_check.encode(),
+                        match_event_handler=lambda pat_id, *_: found.append(pat_id) or 1,
+                    )
+                except hyperscan.ScanTerminated:
+                    pass
+                if found:
+                    return False, (
+                        f"Content contains banned item: '{self._hs_terms[found[0]]}'. "
+                        "Please remove it and try again."
+                    )
+            elif self._automaton is not None:
+                hit = next(self._automaton.iter(text_to_check), None)
+                if hit is not None:
+                    return False, (
+                        f"Content contains banned item: '{hit[1]}'. "
+                        "Please remove it and try again."
+                    )
+            else:
+                if self._fast is not None and not self._fast(text_to_check):
+                    return True, None
+                # filter() with the bound __contains__ runs the whole
+                # per-term loop in C with no Python frame per item; the
+                # substring search underneath is the runtime's
+                # SIMD-accelerated memmem
+                hit_item = next(filter(text_to_check.__contains__, self._scan_order), None)
+                if hit_item is not None:
+                    return False, (
+                        f"Content contains banned item: '{hit_item}'. "
+                        "Please remove it and try again."
+                    )
+        elif self._tokens_only:
+            # One tokenization pass, then O(1) membership per term
+            text_to_check = value if self.case_sensitive else _lower(value)
+            tokens = frozenset(_TOKEN_RE.findall(text_to_check))
+            hit_item = next(filter(tokens.__contains__, self._scan_order), None)
+            if hit_item is not None:
+                return False, (
+                    f"Content contains banned word: '{hit_item}'. "
+                    "Please remove it and try again."
+                )
+        elif self._word_pattern is not None:
+            match = self._word_pattern.search(value)
+            if match:
+                banned_item = match.group(0) if self.case_sensitive else match.group(0).lower()
+                return False, (
+                    f"Content contains banned word: '{banned_item}'. "
+                    "Please remove it and try again."
+                )
+
+        # No banned content found
+        return True, None
 
 
 def create_ban_list_guard(banned_items: List[str], **kwargs) -> BanListGuard:
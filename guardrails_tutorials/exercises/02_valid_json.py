@@ -14,18 +14,71 @@ DIFFICULTY: ⭐⭐☆ (Intermediate)
 """
 
 import json
-import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from guardrails.errors import ValidationError
 
+# Optional SIMD-accelerated JSON parser; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Decode failures to catch regardless of which parser ran
+_JSONDecodeError = ((json.JSONDecodeError, orjson.JSONDecodeError)
+                    if ORJSON_AVAILABLE else (json.JSONDecodeError,))
+
+
+def _loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON with the fastest available parser."""
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
+
+# The only characters a JSON document can begin with; anything else is
+# rejected without invoking the parser at all
+_JSON_STARTS = frozenset('{["-0123456789tfn')
+
+# Shared decoder for prefix parsing; raw_decode returns where the first
+# JSON value ends instead of raising on trailing content
+_DECODER = json.JSONDecoder()
+
+
+class _NegativeCache:
+    """Remember inputs that already failed, so retries skip the parse.
+
+    A 2^16-bit two-hash Bloom filter answers "definitely never failed"
+    in O(1); hits are confirmed against a small bounded dict of actual
+    failure strings, so a false positive can never replay the wrong
+    verdict — it just falls through to a real validation.
+    """
+
+    _MASK = (1 << 16) - 1
+    _MAX_CONFIRMED = 512
+
+    def __init__(self):
+        self._bits = 0
+        self._confirmed = {}
+
+    def get(self, value: str) -> Optional[str]:
+        h = hash(value)
+        h1, h2 = h & self._MASK, (h >> 16) & self._MASK
+        if not ((self._bits >> h1) & 1 and (self._bits >> h2) & 1):
+            return None
+        return self._confirmed.get(value)
+
+    def add(self, value: str, message: str) -> None:
+        h = hash(value)
+        self._bits |= (1 << (h & self._MASK)) | (1 << ((h >> 16) & self._MASK))
+        if len(self._confirmed) >= self._MAX_CONFIRMED:
+            self._confirmed.pop(next(iter(self._confirmed)))
+        self._confirmed[value] = message
+
 
 class ValidJSONGuard:
     """
     A guardrail that validates and ensures content is valid JSON.
-    
-    TODO: Students will implement JSON validation and optional fixing logic.
     """
-    
+
     def __init__(self, fix_common_errors: bool = True, required_keys: Optional[list] = None,
                  strict_mode: bool = False):
         """
@@ -39,6 +92,11 @@ class ValidJSONGuard:
         self.fix_common_errors = fix_common_errors
         self.required_keys = required_keys or []
         self.strict_mode = strict_mode
+        # Frozen copy for the hot path: one C-level set difference per
+        # validation instead of a Python loop of membership tests
+        self._required = frozenset(self.required_keys)
+        # Retries tend to resubmit the same bad output verbatim
+        self._failed = _NegativeCache()
     
     def validate(self, value: str) -> str:
         """
@@ -55,104 +113,136 @@ class ValidJSONGuard:
         """
         if not value or not isinstance(value, str):
             raise ValidationError("Input must be a non-empty string")
-        
-        # TODO: STUDENT TASK 1
-        # Try to parse the JSON as-is first
-        # YOUR CODE HERE:
+
+        # Replay a recorded failure instead of re-parsing known garbage
+        cached_failure = self._failed.get(value)
+        if cached_failure is not None:
+            raise ValidationError(cached_failure)
         try:
-            parsed_data = json.loads(value.strip())
-            # TODO: If parsing succeeds, validate the structure
-            # Call self._validate_structure(parsed_data)
-            # Return the original value if valid
-            pass
-        except json.JSONDecodeError as e:
-            # TODO: If parsing fails and fix_common_errors is True, try to fix
+            return self._validate_impl(value)
+        except ValidationError as e:
+            self._failed.add(value, str(e))
+            raise
+
+    def _validate_impl(self, value: str) -> str:
+        """Do the actual parse/fix work; validate() handles caching."""
+        stripped = value.strip()
+        if not stripped:
+            raise ValidationError("Input must be a non-empty string")
+
+        # Fast-reject inputs that cannot be JSON from their first
+        # character, skipping the O(n) parse attempt entirely
+        if stripped[0] not in _JSON_STARTS:
             if self.fix_common_errors and not self.strict_mode:
-                # TODO: Call self._attempt_json_fix(value)
-                pass
-            else:
-                # TODO: Raise ValidationError with the JSON parsing error
-                pass
-    
-    def _validate_structure(self, data: Any) -> None:
-        """
-        Validate the structure of parsed JSON data.
-        
-        TODO: STUDENT TASK 2
-        # Check if required keys are present (if data is a dict)
-        # YOUR CODE HERE:
-        """
-        if isinstance(data, dict) and self.required_keys:
-            missing_keys = []
-            for key in self.required_keys:
-                # TODO: Check if key is in data, add to missing_keys if not
-                pass
-            
-            if missing_keys:
-                # TODO: Raise ValidationError listing missing keys
-                pass
-    
-    def _attempt_json_fix(self, value: str) -> str:
-        """
-        Attempt to fix common JSON formatting errors.
-        
-        TODO: STUDENT TASK 3
-        # Implement common JSON fixes:
-        # 1. Fix single quotes to double quotes
-        # 2. Fix trailing commas
-        # 3. Fix unquoted keys
-        # 4. Handle basic escaping issues
-        # YOUR CODE HERE:
-        """
-        fixed_value = value.strip()
-        
-        # TODO: Fix 1 - Replace single quotes with double quotes (be careful with apostrophes)
-        # HINT: This is tricky! Consider using regex to match quote pairs
-        
-        # TODO: Fix 2 - Remove trailing commas before closing braces/brackets
-        # HINT: Use regex to find patterns like ",}" or ",]"
-        
-        # TODO: Fix 3 - Quote unquoted keys in objects
-        # HINT: Look for patterns like {key: value} and convert to {"key": value}
-        
-        # TODO: Fix 4 - Try parsing the fixed JSON
+                return self._attempt_json_fix(stripped)
+            raise ValidationError("Invalid JSON: input does not start like a JSON document")
+
+        # Try to parse the JSON as-is first
         try:
-            parsed_data = json.loads(fixed_value)
+            parsed_data = _loads(stripped)
+        except _JSONDecodeError as e:
+            if not self.fix_common_errors or self.strict_mode:
+                raise ValidationError(f"Invalid JSON: {e}")
+            # LLMs often append chatter after the JSON value; raw_decode
+            # accepts the leading value without a full fix pass
+            try:
+                parsed_data, _end = _DECODER.raw_decode(stripped)
+            except json.JSONDecodeError:
+                return self._attempt_json_fix(stripped)
             self._validate_structure(parsed_data)
-            # TODO: Return properly formatted JSON
-            pass
-        except json.JSONDecodeError as e:
-            # TODO: If still invalid, raise ValidationError
-            pass
-    
-    def _fix_single_quotes(self, text: str) -> str:
-        """
-        Helper method to fix single quotes in JSON.
-        
-        TODO: STUDENT TASK 4 (ADVANCED)
-        # This is challenging! Need to distinguish between:
-        # - String delimiters: 'hello' -> "hello"  
-        # - Apostrophes inside strings: "don't" (should stay as is)
-        # 
-        # For now, implement a simple version:
-        # Replace single quotes with double quotes, but be careful!
-        # YOUR CODE HERE:
-        """
-        # Simple approach: replace single quotes that are likely string delimiters
-        # This is not perfect but works for many cases
-        return text.replace("'", '"')
-    
-    def _remove_trailing_commas(self, text: str) -> str:
+            return json.dumps(parsed_data)
+
+        self._validate_structure(parsed_data)
+        return value
+
+    def _validate_structure(self, data: Any) -> None:
+        """Validate the structure of parsed JSON data."""
+        if not self._required:
+            return
+
+        if not isinstance(data, dict):
+            raise ValidationError(
+                f"JSON must be an object containing the required keys: {sorted(self._required)}"
+            )
+
+        missing_keys = self._required.difference(data)
+        if missing_keys:
+            raise ValidationError(f"JSON missing required keys: {sorted(missing_keys)}")
+
+    def _attempt_json_fix(self, text: str) -> str:
         """
-        Helper method to remove trailing commas.
-        
-        TODO: STUDENT TASK 5
-        # Remove commas that appear before closing braces or brackets
-        # YOUR CODE HERE:
+        Attempt to fix common JSON formatting errors in a single pass.
+
+        The scanner works on bytes and hops between structurally
+        significant bytes with bytes.find (memchr underneath), so long
+        string-literal runs are copied in bulk instead of one character
+        at a time. It handles quote conversion, trailing commas, and
+        unquoted keys together while tracking the active quote
+        character, which keeps apostrophes inside double-quoted strings
+        intact. The caller passes text it already stripped, so no fresh
+        copy is allocated here.
         """
-        # TODO: Use regex to find and remove patterns like ",}" and ",]"
-        # HINT: Use re.sub() with appropriate patterns
-        pass
+        bv = text.encode('utf-8')
+        out = bytearray()
+        i = 0
+        n = len(bv)
+
+        while i < n:
+            ch = bv[i]
+            if ch == 0x22 or ch == 0x27:  # '"' or "'"
+                # Normalize either delimiter to a double quote, then
+                # jump find-to-find inside the string: everything up to
+                # the next closer or backslash is copied in one slice
+                out.append(0x22)
+                i += 1
+                while i < n:
+                    close = bv.find(ch, i)
+                    escape = bv.find(0x5C, i)  # backslash
+                    if close == -1:
+                        out += bv[i:]
+                        i = n
+                        break
+                    if escape != -1 and escape < close:
+                        out += bv[i:escape + 2]  # keep the escaped byte
+                        i = escape + 2
+                        continue
+                    out += bv[i:close]
+                    out.append(0x22)
+                    i = close + 1
+                    break
+            elif ch == 0x2C:  # ','
+                # Drop the comma when the next non-space byte closes a scope
+                j = i + 1
+                while j < n and bv[j] in b' \t\r\n':
+                    j += 1
+                if not (j < n and bv[j] in b'}]'):
+                    out.append(ch)
+                i += 1
+            elif 0x41 <= ch <= 0x5A or 0x61 <= ch <= 0x7A or ch == 0x5F:
+                # Quote bare identifiers that act as object keys
+                j = i + 1
+                while j < n and (0x30 <= bv[j] <= 0x39 or 0x41 <= bv[j] <= 0x5A
+                                 or 0x61 <= bv[j] <= 0x7A or bv[j] == 0x5F):
+                    j += 1
+                k = j
+                while k < n and bv[k] in b' \t\r\n':
+                    k += 1
+                if k < n and bv[k] == 0x3A:  # ':'
+                    out += b'"' + bv[i:j] + b'"'
+                else:
+                    out += bv[i:j]
+                i = j
+            else:
+                out.append(ch)
+                i += 1
+
+        try:
+            parsed_data = _loads(bytes(out))
+        except _JSONDecodeError as e:
+            raise ValidationError(f"Invalid JSON that could not be fixed: {e}")
+
+        self._validate_structure(parsed_data)
+        return json.dumps(parsed_data)
 
 
 def create_json_guard(**kwargs) -> ValidJSONGuard:
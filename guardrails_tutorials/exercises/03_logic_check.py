@@ -18,19 +18,163 @@ import math
 from typing import List, Dict, Any, Tuple, Optional
 from guardrails.errors import ValidationError
 
+# Optional Hyperscan engine: scans every logic pattern in one SIMD pass
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Optional RE2 engine: its Set type fills the same role with a
+# linear-time DFA when Hyperscan is absent
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional NumPy: checks large batches of arithmetic statements in one
+# vectorized comparison instead of a Python loop
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Texts with at least this many formulas of one kind go vectorized
+_VECTORIZE_MIN = 32
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile through RE2's linear-time engine when it can take the pattern.
+
+    RE2 guarantees linear worst-case matching, so adversarial inputs
+    cannot trigger the backtracking blowups possible with re. Patterns
+    it rejects fall back to the stdlib engine.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# Predefined contradiction patterns, compiled once at import so every
+# guard instance shares the same pattern objects
+_CONTRADICTION_PATTERNS = [
+    (r'\b(?:always|never)\b.*\b(?:sometimes|occasionally)\b',
+     "Absolute vs. conditional statements"),
+    (r'\b(?:all|every)\b.*\b(?:some|few|many)\b.*\b(?:cannot|not|n\'t)\b',
+     "Universal vs. particular statements"),
+    (r'\b(?:impossible|can\'t)\b.*\b(?:possible|can|could)\b',
+     "Possibility contradictions"),
+    (r'\b(?:increas\w+|rise|rose|rising|grow\w*|grew)\b.*'
+     r'\b(?:decreas\w+|fall\w*|fell|shrink\w*|shrank)\b',
+     "Directional contradictions"),
+]
+_CONTRADICTION_RES = tuple(
+    (_compile(pattern, re.IGNORECASE), description)
+    for pattern, description in _CONTRADICTION_PATTERNS
+)
+
+# Causal patterns: a connective followed by a cause and an effect the
+# cause should rule out
+_CAUSAL_PATTERNS = [
+    (r'(?:because|due to|since)\b.*?\b(?:rain|raining)\b.*?\b(?:dry|drought)\b',
+     "Rain should not cause dryness"),
+    (r'(?:because|due to|since)\b.*?\b(?:heat|hot)\b.*?\b(?:cold|froze|freez\w+)\b',
+     "Heat should not cause freezing"),
+    (r'(?:because|due to|since)\b.*?\b(?:exercise|exercising)\b.*?\b(?:weak\w*|lazy|laziness)\b',
+     "Exercise should not cause weakness"),
+]
+_CAUSAL_RES = tuple(
+    (_compile(pattern, re.IGNORECASE), description)
+    for pattern, description in _CAUSAL_PATTERNS
+)
+
+# Fuse contradiction + causal patterns into one multi-pattern engine
+# when available: a single scan per validate() replaces the per-pattern
+# search loop, and the hit ids index straight into the description
+# tables. Built once here; instances only bind references.
+_N_CONTRADICTIONS = len(_CONTRADICTION_PATTERNS)
+_LOGIC_SOURCES = ([pattern for pattern, _ in _CONTRADICTION_PATTERNS]
+                  + [pattern for pattern, _ in _CAUSAL_PATTERNS])
+_HS_DB = None
+if HYPERSCAN_AVAILABLE:
+    try:
+        _db = hyperscan.Database()
+        _db.compile(
+            expressions=[pattern.encode() for pattern in _LOGIC_SOURCES],
+            ids=list(range(len(_LOGIC_SOURCES))),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(_LOGIC_SOURCES),
+        )
+        _HS_DB = _db
+    except hyperscan.error:
+        _HS_DB = None  # Unsupported construct; use the re path
+_RE2_SET = None
+if _HS_DB is None and RE2_AVAILABLE:
+    try:
+        _pattern_set = re2.Set.SearchSet()
+        for _pattern in _LOGIC_SOURCES:
+            _pattern_set.Add('(?i)' + _pattern)
+        _pattern_set.Compile()
+        _RE2_SET = _pattern_set
+    except Exception:
+        _RE2_SET = None  # Unsupported construct; use the re path
+
+# All four arithmetic statement shapes fused into one alternation; a
+# single finditer pass replaces four full scans and the named groups
+# tell the checker which operation matched
+_MATH_RE = _compile(
+    r'(?:(?P<a1>\d+)\s*\+\s*(?P<a2>\d+)\s*=\s*(?P<a3>\d+))'
+    r'|(?:(?P<s1>\d+)\s*-\s*(?P<s2>\d+)\s*=\s*(?P<s3>\d+))'
+    r'|(?:(?P<m1>\d+)\s*[*×]\s*(?P<m2>\d+)\s*=\s*(?P<m3>\d+))'
+    r'|(?:(?P<p1>\d+)%\s+of\s+(?P<p2>\d+)\s+is\s+(?P<p3>\d+))',
+    re.IGNORECASE,
+)
+
+# Numeric contradictions ("increased from $100 to $80"): one pattern per
+# direction captures both values, so a single pass plus an integer
+# compare replaces separate scans
+_INC_RE = _compile(
+    r'\b(?:increas|rose|rise|grew|grow|climb)\w*\s+from\s+\$?(\d+)\s+to\s+\$?(\d+)',
+    re.IGNORECASE,
+)
+_DEC_RE = _compile(
+    r'\b(?:decreas|fell|fall|shrank|shrink|dropp?|declin)\w*\s+from\s+\$?(\d+)\s+to\s+\$?(\d+)',
+    re.IGNORECASE,
+)
+
+_NUMBER_RE = _compile(r'\d+(?:\.\d+)?')
+
+
+def _wrong_triples(triples: List[Tuple[int, int, int]], bad) -> Any:
+    """Yield the (a, b, c) rows failing the check, vectorized when large."""
+    if NUMPY_AVAILABLE and len(triples) >= _VECTORIZE_MIN:
+        try:
+            arr = np.asarray(triples, dtype=np.int64)
+        except OverflowError:
+            pass  # An operand exceeds int64 (\d+ is unbounded); go scalar
+        else:
+            for i in np.nonzero(bad(arr[:, 0], arr[:, 1], arr[:, 2]))[0]:
+                yield triples[i]
+            return
+    for triple in triples:
+        if bad(*triple):
+            yield triple
+
 
 class LogicCheckGuard:
     """
     A guardrail that performs logical consistency checks on content.
-    
-    TODO: Students will implement various logical validation methods.
     """
-    
+
     def __init__(self, check_contradictions: bool = True, check_math: bool = True,
                  check_causality: bool = True, strict_mode: bool = False):
         """
         Initialize the logic check guardrail.
-        
+
         Args:
             check_contradictions: Whether to check for logical contradictions
             check_math: Whether to validate mathematical statements
@@ -41,14 +185,30 @@ class LogicCheckGuard:
         self.check_math = check_math
         self.check_causality = check_causality
         self.strict_mode = strict_mode
-        
-        # Predefined contradiction patterns
-        self.contradiction_patterns = [
-            (r'\b(always|never)\b.*\b(sometimes|occasionally)\b', "Absolute vs. conditional statements"),
-            (r'\b(all|every)\b.*\b(some|few|many)\b.*\b(not|n\'t)\b', "Universal vs. particular statements"),
-            (r'\b(impossible|can\'t)\b.*\b(possible|can|could)\b', "Possibility contradictions"),
-            (r'\b(increase|rise|grow)\b.*\b(decrease|fall|shrink)\b', "Directional contradictions"),
-        ]
+
+        # All pattern state is compiled once at module level; instances
+        # just bind references, so constructing a guard is constant time
+        self._contradiction_res = _CONTRADICTION_RES
+        self._causal_res = _CAUSAL_RES
+        self._n_contradictions = _N_CONTRADICTIONS
+        self._hs_db = _HS_DB
+        self._re2_set = _RE2_SET
+        self._math_re = _MATH_RE
+        self._inc_re = _INC_RE
+        self._dec_re = _DEC_RE
+        self._number_re = _NUMBER_RE
+
+        # Dispatch table of enabled checks, resolved once here so
+        # validate() iterates bound methods instead of testing the
+        # three feature flags on every call
+        self._needs_scan = check_contradictions or check_causality
+        self._checks = tuple(
+            check for enabled, check in (
+                (check_contradictions, self._check_contradictions),
+                (check_math, self._check_mathematical_consistency),
+                (check_causality, self._check_causality),
+            ) if enabled
+        )
     
     def validate(self, value: str) -> str:
         """
@@ -65,140 +225,130 @@ class LogicCheckGuard:
         """
         if not value or not isinstance(value, str):
             return value
-        
+
         issues = []
-        
-        # TODO: STUDENT TASK 1
-        # Check for contradictions if enabled
-        if self.check_contradictions:
-            # TODO: Call self._check_contradictions(value) and add any issues
-            pass
-        
-        # TODO: STUDENT TASK 2  
-        # Check mathematical consistency if enabled
-        if self.check_math:
-            # TODO: Call self._check_mathematical_consistency(value) and add any issues
-            pass
-        
-        # TODO: STUDENT TASK 3
-        # Check causal relationships if enabled
-        if self.check_causality:
-            # TODO: Call self._check_causality(value) and add any issues
-            pass
-        
-        # TODO: If any issues found, raise ValidationError
+
+        # One fused scan covers both pattern-based checks when a
+        # multi-pattern engine compiled; None means scan per pattern
+        hit_ids = self._scan_logic_ids(value) if self._needs_scan else None
+
+        for check in self._checks:
+            issues.extend(check(value, hit_ids))
+
         if issues:
-            # TODO: Create comprehensive error message from all issues
-            pass
-        
+            raise ValidationError(
+                "Logical inconsistencies detected: " + "; ".join(issues)
+            )
+
         return value
-    
-    def _check_contradictions(self, text: str) -> List[str]:
-        """
-        Check for logical contradictions in the text.
-        
-        TODO: STUDENT TASK 4
-        # Use self.contradiction_patterns to find contradictions
-        # Return list of contradiction descriptions
-        # YOUR CODE HERE:
-        """
-        contradictions = []
-        text_lower = text.lower()
-        
-        for pattern, description in self.contradiction_patterns:
-            # TODO: Use re.search to find pattern matches
-            # If found, add description to contradictions list
-            pass
-        
-        # TODO: ADVANCED - Check for numeric contradictions
-        # Example: "The price increased from $100 to $80" (increase but lower number)
-        
+
+    def _scan_logic_ids(self, text: str) -> Optional[frozenset]:
+        """Run the fused engine once; None means no engine compiled."""
+        if self._hs_db is not None:
+            hit_ids = set()
+            self._hs_db.scan(text.encode(),
+                             match_event_handler=lambda pat_id, *_: hit_ids.add(pat_id))
+            return frozenset(hit_ids)
+        if self._re2_set is not None:
+            return frozenset(self._re2_set.Match(text) or ())
+        return None
+
+    def _check_contradictions(self, text: str, hit_ids: Optional[frozenset] = None) -> List[str]:
+        """Check for logical contradictions in the text."""
+        if hit_ids is not None:
+            contradictions = [description
+                              for i, (_, description) in enumerate(self._contradiction_res)
+                              if i in hit_ids]
+        else:
+            # IGNORECASE on the compiled patterns folds case in the
+            # engine, so no lowered copy of the text is allocated
+            contradictions = []
+
+            for pattern, description in self._contradiction_res:
+                if pattern.search(text):
+                    contradictions.append(description)
+
+        # Numeric contradictions: the stated direction must agree with
+        # the captured values
+        for match in self._inc_re.finditer(text):
+            start, end = int(match.group(1)), int(match.group(2))
+            if start >= end:
+                contradictions.append(
+                    f"Claimed increase from {start} to {end}"
+                )
+        for match in self._dec_re.finditer(text):
+            start, end = int(match.group(1)), int(match.group(2))
+            if start <= end:
+                contradictions.append(
+                    f"Claimed decrease from {start} to {end}"
+                )
+
         return contradictions
-    
-    def _check_mathematical_consistency(self, text: str) -> List[str]:
-        """
-        Check for mathematical inconsistencies.
-        
-        TODO: STUDENT TASK 5
-        # Find and validate mathematical expressions
-        # Check calculations like "2 + 2 = 5" (should be 4)
-        # Check percentages, ratios, and basic arithmetic
-        # YOUR CODE HERE:
+
+    def _check_mathematical_consistency(self, text: str,
+                                        hit_ids: Optional[frozenset] = None) -> List[str]:
+        """Check arithmetic statements like '2 + 2 = 5' for correctness.
+
+        hit_ids is accepted for uniform dispatch but unused: arithmetic
+        needs the captured operands, not just pattern presence.
         """
+        adds: List[Tuple[int, int, int]] = []
+        subs: List[Tuple[int, int, int]] = []
+        muls: List[Tuple[int, int, int]] = []
+        pcts: List[Tuple[int, int, int]] = []
+
+        for match in self._math_re.finditer(text):
+            if match.group('a1') is not None:
+                adds.append((int(match.group('a1')), int(match.group('a2')), int(match.group('a3'))))
+            elif match.group('s1') is not None:
+                subs.append((int(match.group('s1')), int(match.group('s2')), int(match.group('s3'))))
+            elif match.group('m1') is not None:
+                muls.append((int(match.group('m1')), int(match.group('m2')), int(match.group('m3'))))
+            else:
+                pcts.append((int(match.group('p1')), int(match.group('p2')), int(match.group('p3'))))
+
         math_issues = []
-        
-        # TODO: Pattern 1 - Simple additions: "X + Y = Z"
-        addition_pattern = r'(\d+)\s*\+\s*(\d+)\s*=\s*(\d+)'
-        # TODO: Use re.findall to find all matches
-        # For each match, check if the calculation is correct
-        # If not, add to math_issues
-        
-        # TODO: Pattern 2 - Simple subtractions: "X - Y = Z"
-        
-        # TODO: Pattern 3 - Simple multiplications: "X * Y = Z" or "X × Y = Z"
-        
-        # TODO: Pattern 4 - Percentage calculations
-        # Example: "50% of 100 is 60" (should be 50)
-        percentage_pattern = r'(\d+)%\s+of\s+(\d+)\s+is\s+(\d+)'
-        # TODO: Implement percentage validation
-        
+
+        for a, b, c in _wrong_triples(adds, lambda a, b, c: a + b != c):
+            math_issues.append(f"Incorrect addition: {a} + {b} = {c} (should be {a + b})")
+
+        for a, b, c in _wrong_triples(subs, lambda a, b, c: a - b != c):
+            math_issues.append(f"Incorrect subtraction: {a} - {b} = {c} (should be {a - b})")
+
+        for a, b, c in _wrong_triples(muls, lambda a, b, c: a * b != c):
+            math_issues.append(f"Incorrect multiplication: {a} × {b} = {c} (should be {a * b})")
+
+        # Integer cross-multiplication avoids float rounding
+        for a, b, c in _wrong_triples(pcts, lambda a, b, c: a * b != c * 100):
+            math_issues.append(f"Incorrect percentage: {a}% of {b} is {c} (should be {a * b / 100:g})")
+
         return math_issues
-    
-    def _check_causality(self, text: str) -> List[str]:
-        """
-        Check for causal relationship inconsistencies.
-        
-        TODO: STUDENT TASK 6
-        # Look for cause-and-effect statements that don't make logical sense
-        # Example: "Because it's raining, the ground is dry"
-        # YOUR CODE HERE:
-        """
+
+    def _check_causality(self, text: str, hit_ids: Optional[frozenset] = None) -> List[str]:
+        """Check for cause-and-effect statements that contradict themselves."""
+        if hit_ids is not None:
+            offset = self._n_contradictions
+            return [description
+                    for i, (_, description) in enumerate(self._causal_res)
+                    if i + offset in hit_ids]
+
         causality_issues = []
-        
-        # Define some basic cause-effect relationships
-        positive_relationships = {
-            "rain": ["wet", "flooding", "puddles"],
-            "heat": ["hot", "warm", "melting", "evaporation"],
-            "cold": ["freezing", "ice", "snow"],
-            "exercise": ["fitness", "strength", "health"],
-        }
-        
-        negative_relationships = {
-            "rain": ["dry", "drought"],
-            "heat": ["cold", "freezing"],
-            "cold": ["hot", "warm"],
-            "exercise": ["weakness", "laziness"],
-        }
-        
-        # TODO: Look for causal patterns like "because X" followed by contradictory effects
-        causal_patterns = [
-            r'because\s+.*?(rain|raining).*?(dry|drought)',
-            r'due to\s+.*?(heat|hot).*?(cold|freezing)',
-            r'since\s+.*?(exercise|exercising).*?(weak|lazy)',
-        ]
-        
-        for pattern in causal_patterns:
-            # TODO: Use re.search to find causal contradictions
-            # Add appropriate descriptions to causality_issues
-            pass
-        
+
+        for pattern, description in self._causal_res:
+            if pattern.search(text):
+                causality_issues.append(description)
+
         return causality_issues
-    
+
     def _extract_numbers_from_text(self, text: str) -> List[Tuple[str, float]]:
-        """
-        Helper method to extract numbers and their context from text.
-        
-        TODO: STUDENT TASK 7 (HELPER METHOD)
-        # Extract numbers along with their surrounding context
-        # Return list of (context, number) tuples
-        # YOUR CODE HERE:
-        """
+        """Helper to extract numbers with a window of surrounding context."""
         numbers = []
-        
-        # TODO: Use regex to find numbers in context
-        # Pattern could be: r'([^.]*?)(\d+(?:\.\d+)?)([^.]*?)'
-        # This gives context before and after each number
-        
+
+        for match in self._number_re.finditer(text):
+            start = max(0, match.start() - 30)
+            end = min(len(text), match.end() + 30)
+            numbers.append((text[start:end].strip(), float(match.group(0))))
+
         return numbers
 
 
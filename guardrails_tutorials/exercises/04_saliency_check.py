@@ -14,16 +14,44 @@ DIFFICULTY: ⭐⭐⭐ (Advanced)
 """
 
 import re
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from collections import Counter
 from guardrails.errors import ValidationError
 
+# Optional Aho-Corasick automaton: finds every keyword, including
+# multi-word phrases, in one linear pass no matter how many there are
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional NumPy: aggregates large word-frequency tables in one
+# vectorized pass
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional scikit-learn: collapses pairwise sentence similarity into
+# one sparse matrix product
+try:
+    from sklearn.feature_extraction.text import CountVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Vocabularies at least this large take the vectorized path
+_VECTORIZE_MIN = 256
+
+# Texts at least this long tokenize through the NumPy byte mask
+_NUMPY_TOKENIZE_MIN = 4096
+
 
 class SaliencyCheckGuard:
     """
     A guardrail that validates content saliency and relevance.
-    
-    TODO: Students will implement saliency checking methods.
     """
     
     def __init__(self, important_keywords: List[str] = None, 
@@ -44,13 +72,43 @@ class SaliencyCheckGuard:
         self.max_irrelevant_ratio = max_irrelevant_ratio
         self.check_focus = check_focus
         
-        # Common stop words to filter out
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 
+        # Common stop words to filter out, frozen so membership tests
+        # hit an immutable table
+        self.stop_words = frozenset({
+            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
             'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
             'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-        }
+        })
+
+        # 256-byte table that lowercases A-Z and turns every non-letter
+        # into a space: tokenization becomes one translate() pass plus
+        # split(), with no regex engine or separate lower() copy
+        self._word_table = bytes(
+            (i | 0x20) if (65 <= i <= 90 or 97 <= i <= 122) else 0x20
+            for i in range(256)
+        )
+        self._stop_bytes = frozenset(word.encode('ascii') for word in self.stop_words)
+        # Stop words of up to four bytes — the overwhelming majority of
+        # hits — packed into little-endian integers, so rejecting them
+        # costs an int hash instead of a string hash
+        self._short_stop_ints = frozenset(
+            int.from_bytes(word, 'little')
+            for word in self._stop_bytes if len(word) <= 4
+        )
+
+        # Compiled once; _split_into_sentences runs per validate call
+        self._sent_re = re.compile(r'[.!?]+')
+
+        # Keyword automaton: one scan of the text counts every keyword
+        # simultaneously instead of one pass per keyword
+        self._keyword_ac = None
+        if AHOCORASICK_AVAILABLE and self.important_keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.important_keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._keyword_ac = automaton
     
     def validate(self, value: str) -> str:
         """
@@ -67,178 +125,248 @@ class SaliencyCheckGuard:
         """
         if not value or not isinstance(value, str):
             return value
-        
-        # TODO: STUDENT TASK 1
-        # Calculate the overall saliency score
-        # Call self._calculate_saliency_score(value)
-        saliency_score = 0.0  # TODO: Implement this
-        
-        # TODO: STUDENT TASK 2
-        # Calculate content focus metrics
+
+        # Cheap presence probe first: str.__contains__ runs an
+        # optimized substring search, so clearly off-topic text is
+        # rejected without paying for tokenization. Since both scoring
+        # paths only count keyword substrings, zero substring hits
+        # guarantees a 0.0 score.
+        if self.important_keywords and not self._contains_any_keyword(value.lower()):
+            saliency_score = 0.0
+            words = None
+        else:
+            # Tokenize once; every metric below reuses the same word
+            # list instead of re-running extraction per check
+            words = self._extract_words(value)
+            saliency_score = self._calculate_saliency_score(value, words)
+
         if self.check_focus:
-            # TODO: Call self._check_content_focus(value)
-            # This should return focus_score and issues list
-            focus_score, focus_issues = 0.0, []  # TODO: Implement this
+            focus_score, focus_issues = self._check_content_focus(value, words)
         else:
             focus_score, focus_issues = 1.0, []
-        
-        # TODO: STUDENT TASK 3
-        # Validate against thresholds and raise errors if needed
+
         issues = []
-        
-        # TODO: Check if saliency_score < self.min_saliency_score
-        # TODO: Add focus_issues to issues list
-        # TODO: If any issues, raise ValidationError
-        
+        if saliency_score < self.min_saliency_score:
+            issues.append(
+                f"Saliency score {saliency_score:.2f} is below the "
+                f"required minimum {self.min_saliency_score}"
+            )
+        issues.extend(focus_issues)
+
+        if issues:
+            raise ValidationError("Content saliency issues: " + "; ".join(issues))
+
         return value
     
-    def _calculate_saliency_score(self, text: str) -> float:
+    def _contains_any_keyword(self, text_lower: str) -> bool:
+        """True if any important keyword occurs anywhere in the text."""
+        if self._keyword_ac is not None:
+            return next(self._keyword_ac.iter(text_lower), None) is not None
+        return any(keyword in text_lower for keyword in self.important_keywords)
+
+    def _calculate_saliency_score(self, text: str, words: Optional[List[str]] = None) -> float:
         """
         Calculate the saliency score of the text based on important keywords.
-        
-        TODO: STUDENT TASK 4
-        # Calculate how much the text focuses on important topics
-        # Higher score = more salient content
-        # Score range: 0.0 to 1.0
-        # YOUR CODE HERE:
+
+        Blends keyword density (how much of the text is on-topic) with
+        keyword variety (how many distinct keywords appear). Scores
+        range 0.0 to 1.0; higher means more salient content.
         """
         if not self.important_keywords:
             return 1.0  # If no keywords specified, assume content is salient
-        
-        words = self._extract_words(text)
+
+        if words is None:
+            words = self._extract_words(text)
         if not words:
             return 0.0
-        
-        # TODO: Count occurrences of important keywords
-        important_word_count = 0
-        total_word_count = len(words)
-        
-        for word in words:
-            # TODO: Check if word is in self.important_keywords
-            # If so, increment important_word_count
-            pass
-        
-        # TODO: Calculate and return saliency score
-        # Formula: important_word_count / total_word_count
-        # But also consider keyword density and variety
-        
-        return 0.0  # TODO: Replace with actual calculation
+
+        text_lower = text.lower()
+        keyword_hits = 0
+        keywords_matched = 0
+
+        if self._keyword_ac is not None:
+            matched = set()
+            for end_pos, keyword in self._keyword_ac.iter(text_lower):
+                start = end_pos - len(keyword) + 1
+                # Only the leading boundary is checked, so "algorithm"
+                # still counts inside "algorithms" like the prefix
+                # matching below
+                if start == 0 or not text_lower[start - 1].isalnum():
+                    keyword_hits += 1
+                    matched.add(keyword)
+            keywords_matched = len(matched)
+        else:
+            for keyword in self.important_keywords:
+                if ' ' in keyword:
+                    # Multi-word phrases are matched against the raw text
+                    hits = text_lower.count(keyword)
+                else:
+                    # startswith tolerates plural/derived forms like
+                    # "algorithms" for the keyword "algorithm"
+                    hits = sum(1 for word in words if word.startswith(keyword))
+                if hits:
+                    keywords_matched += 1
+                    keyword_hits += hits
+
+        density = keyword_hits / len(words)
+        variety = keywords_matched / len(self.important_keywords)
+
+        return min(1.0, 0.7 * density + 0.3 * variety)
     
-    def _check_content_focus(self, text: str) -> Tuple[float, List[str]]:
+    def _check_content_focus(self, text: str, words: Optional[List[str]] = None) -> Tuple[float, List[str]]:
         """
         Check how focused and coherent the content is.
-        
-        TODO: STUDENT TASK 5
-        # Analyze content focus using various metrics:
-        # 1. Topic consistency
-        # 2. Sentence coherence
-        # 3. Repetition patterns
-        # 4. Tangent detection
-        # YOUR CODE HERE:
+
+        Combines three metrics: topic consistency (share of sentences
+        touching an important keyword), repetition, and average pairwise
+        sentence similarity. The similarity average feeds the focus
+        score but is advisory only — short factual sentences
+        legitimately share few words.
         """
         issues = []
         sentences = self._split_into_sentences(text)
-        
+
         if len(sentences) == 0:
             return 0.0, ["No sentences found"]
-        
-        # TODO: Metric 1 - Check for topic consistency
-        # Calculate similarity between sentences
-        topic_consistency_score = 0.0  # TODO: Implement
-        
-        # TODO: Metric 2 - Check for excessive repetition
-        repetition_score = self._check_repetition(text)
-        
-        # TODO: Metric 3 - Check for tangential content
-        # Detect sentences that seem unrelated to main topic
-        tangent_score = 0.0  # TODO: Implement
-        
-        # TODO: Combine scores into overall focus score
-        focus_score = 0.0  # TODO: Calculate from metrics above
-        
-        # TODO: Add issues based on low scores
+
+        # Metric 1 - topic consistency: how many sentences mention at
+        # least one important keyword (always consistent with none set)
+        if self.important_keywords:
+            relevant = sum(
+                1 for sentence in sentences
+                if any(keyword in sentence.lower() for keyword in self.important_keywords)
+            )
+            topic_consistency_score = relevant / len(sentences)
+        else:
+            topic_consistency_score = 1.0
+
+        # Metric 2 - excessive repetition
+        repetition_score = self._check_repetition(text, words)
+
+        # Metric 3 - pairwise sentence similarity
+        if len(sentences) > 1:
+            similarity_score = self._mean_pairwise_similarity(sentences)
+        else:
+            similarity_score = 1.0
+
+        focus_score = (topic_consistency_score + repetition_score + similarity_score) / 3
+
         if topic_consistency_score < 0.5:
             issues.append("Low topic consistency detected")
-        
+
         if repetition_score < 0.3:
             issues.append("Excessive repetition detected")
-        
+
+        # Tangent detection: off-topic sentences beyond the allowed ratio
+        irrelevant_ratio = 1.0 - topic_consistency_score
+        if irrelevant_ratio > self.max_irrelevant_ratio:
+            issues.append(f"Too much irrelevant content ({irrelevant_ratio:.0%})")
+
         return focus_score, issues
     
     def _extract_words(self, text: str) -> List[str]:
-        """
-        Extract meaningful words from text, filtering out stop words.
-        
-        TODO: STUDENT TASK 6
-        # Extract words and filter out stop words and punctuation
-        # Convert to lowercase for consistency
-        # YOUR CODE HERE:
-        """
-        # TODO: Use regex to extract words (letters only)
-        # TODO: Convert to lowercase
-        # TODO: Filter out stop words
-        # TODO: Return list of meaningful words
-        
+        """Extract meaningful lowercase words, filtering out stop words."""
+        # errors='replace' keeps non-ASCII from merging adjacent words;
+        # the '?' placeholder maps to a space through the table
+        cleaned = text.encode('ascii', 'replace').translate(self._word_table)
+
+        if NUMPY_AVAILABLE and len(cleaned) >= _NUMPY_TOKENIZE_MIN:
+            # Long texts: find word boundaries as sign changes in a
+            # vectorized letter mask, then slice the buffer directly
+            arr = np.frombuffer(cleaned, dtype=np.uint8)
+            is_letter = (arr != 0x20).view(np.int8)
+            boundaries = np.diff(is_letter, prepend=np.int8(0), append=np.int8(0))
+            starts = np.nonzero(boundaries == 1)[0].tolist()
+            ends = np.nonzero(boundaries == -1)[0].tolist()
+            tokens = (cleaned[start:end] for start, end in zip(starts, ends))
+        else:
+            tokens = cleaned.split()
+
+        # Short tokens (the common case, and where nearly all stop
+        # words live) are rejected through the packed-int table
+        short_stop_ints = self._short_stop_ints
+        stop_bytes = self._stop_bytes
         words = []
-        # TODO: Implement word extraction
+        for token in tokens:
+            if len(token) <= 4:
+                if int.from_bytes(token, 'little') in short_stop_ints:
+                    continue
+            elif token in stop_bytes:
+                continue
+            words.append(token.decode('ascii'))
         return words
-    
+
     def _split_into_sentences(self, text: str) -> List[str]:
-        """
-        Split text into sentences.
-        
-        TODO: STUDENT TASK 7
-        # Split text by sentence boundaries
-        # YOUR CODE HERE:
-        """
-        # TODO: Split by sentence-ending punctuation
-        # TODO: Clean up empty sentences
-        sentences = []
-        # TODO: Implement sentence splitting
-        return sentences
-    
-    def _check_repetition(self, text: str) -> float:
+        """Split text into sentences at terminal punctuation."""
+        sentences = self._sent_re.split(text)
+        return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+    def _check_repetition(self, text: str, words: Optional[List[str]] = None) -> float:
         """
         Check for excessive repetition in content.
-        
-        TODO: STUDENT TASK 8
-        # Calculate a score for content repetition
-        # Lower score = more repetitive content
-        # Score range: 0.0 to 1.0
-        # YOUR CODE HERE:
+
+        Scores 1.0 when vocabulary is varied and approaches 0.0 as a
+        single word dominates the text.
         """
-        words = self._extract_words(text)
+        if words is None:
+            words = self._extract_words(text)
         if len(words) < 2:
             return 1.0
-        
-        # TODO: Count word frequencies
-        word_counts = {}  # TODO: Use Counter or dict
-        
-        # TODO: Calculate repetition metrics
-        # Consider: word frequency distribution, repeated phrases
-        
-        # TODO: Return score where 1.0 = no repetition, 0.0 = highly repetitive
-        return 1.0  # TODO: Replace with actual calculation
-    
-    def _calculate_sentence_similarity(self, sent1: str, sent2: str) -> float:
+
+        word_counts = Counter(words)
+        if NUMPY_AVAILABLE and len(word_counts) >= _VECTORIZE_MIN:
+            counts = np.fromiter(word_counts.values(), dtype=np.int64,
+                                 count=len(word_counts))
+            max_frequency = int(counts.max())
+        else:
+            max_frequency = max(word_counts.values())
+
+        return max(0.0, 1.0 - 2.0 * max_frequency / len(words))
+
+    def _mean_pairwise_similarity(self, sentences: List[str]) -> float:
         """
-        Calculate similarity between two sentences (simple word overlap method).
-        
-        TODO: STUDENT TASK 9 (ADVANCED)
-        # Calculate similarity using word overlap
-        # Score range: 0.0 to 1.0
-        # YOUR CODE HERE:
+        Average similarity across all sentence pairs.
+
+        With scikit-learn installed and enough sentences, the O(S^2)
+        pair loop collapses into one sparse binary-cosine matrix
+        product; otherwise Jaccard runs per pair over word sets built
+        once per sentence.
         """
-        words1 = set(self._extract_words(sent1))
-        words2 = set(self._extract_words(sent2))
-        
+        n = len(sentences)
+
+        if SKLEARN_AVAILABLE and NUMPY_AVAILABLE and n >= 4:
+            try:
+                vectorizer = CountVectorizer(binary=True, stop_words=list(self.stop_words))
+                matrix = vectorizer.fit_transform(sentences).astype(np.float32)
+                norms = np.sqrt(np.asarray(matrix.sum(axis=1)).ravel())
+                sims = np.asarray((matrix @ matrix.T).todense(), dtype=np.float32)
+                denom = np.outer(norms, norms)
+                sims = np.where(denom > 0, sims / np.where(denom > 0, denom, 1.0), 0.0)
+                upper = np.triu_indices(n, k=1)
+                return float(sims[upper].mean())
+            except ValueError:
+                pass  # e.g. vocabulary empty after stop-word pruning
+
+        sentence_words = [frozenset(self._extract_words(s)) for s in sentences]
+        pair_sims = []
+        for i in range(n):
+            for j in range(i + 1, n):
+                pair_sims.append(self._jaccard(sentence_words[i], sentence_words[j]))
+        return sum(pair_sims) / len(pair_sims)
+
+    @staticmethod
+    def _jaccard(words1: Set[str], words2: Set[str]) -> float:
+        """Jaccard index of two word sets (intersection over union)."""
         if not words1 or not words2:
             return 0.0
-        
-        # TODO: Calculate Jaccard similarity or similar metric
-        # Jaccard = intersection / union
-        
-        return 0.0  # TODO: Replace with actual calculation
+        return len(words1 & words2) / len(words1 | words2)
+
+    def _calculate_sentence_similarity(self, sent1: str, sent2: str) -> float:
+        """Calculate similarity between two sentences (simple word overlap method)."""
+        return self._jaccard(
+            set(self._extract_words(sent1)),
+            set(self._extract_words(sent2)),
+        )
 
 
 def create_saliency_guard(**kwargs) -> SaliencyCheckGuard: